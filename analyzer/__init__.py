@@ -3,6 +3,13 @@ TrackFlow Package
 Audio analysis tools for DJs
 """
 
-from .audio_analyzer import AudioAnalyzer
-
 __all__ = ['AudioAnalyzer']
+
+
+def __getattr__(name):
+    # AudioAnalyzer pulls in scipy.signal (~0.5 s); import it on first use so
+    # submodules like analyzer.batch_analyzer stay cheap to import
+    if name == 'AudioAnalyzer':
+        from .audio_analyzer import AudioAnalyzer
+        return AudioAnalyzer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -15,6 +15,9 @@ from mutagen import File as MutagenFile
 from pathlib import Path
 import json
 
+from analyzer.quick_probe import read_audio_info
+from analyzer.features import FEATURE_NORM_VERSION, l2_normalize
+
 
 class AudioAnalyzer:
     """Fast audio analysis — BPM, key, energy from first 60 seconds."""
@@ -70,10 +73,8 @@ class AudioAnalyzer:
             'metadata': metadata,
             'audio_info': audio_info,
             'duration': audio_info.get('duration', len(y) / sr),
-            'features': {
-                'mfcc':   self._compute_mfcc(S_power, sr),
-                'chroma': chroma_avg.tolist(),
-            },
+            'features': self._build_features(
+                self._compute_mfcc(S_power, sr), chroma_avg.tolist()),
         }
 
         return results
@@ -236,6 +237,22 @@ class AudioAnalyzer:
         # DCT-II across mel bands -> MFCC; keep coefficients 0..n_mfcc-1
         mfcc_matrix = _dct(log_mel, axis=0, norm='ortho')[:n_mfcc, :]
         return mfcc_matrix.mean(axis=1).tolist()
+
+    @staticmethod
+    def _build_features(mfcc, chroma):
+        """Package the similarity features, L2-normalised over the joint vector.
+
+        Normalising once at write time lets similarity search score tracks
+        with a plain dot product instead of a per-query cosine.
+        """
+        vec = l2_normalize(np.asarray(mfcc + chroma, dtype=np.float64))
+        n = len(mfcc)
+        return {
+            'mfcc':         vec[:n].tolist(),
+            'chroma':       vec[n:].tolist(),
+            'norm_version': FEATURE_NORM_VERSION,
+        }
+
     def _is_major_key(self, chroma_avg):
         """Krumhansl-Schmuckler major/minor classification."""
         major_profile = np.array([6.35, 2.23, 3.48, 2.33, 4.38, 4.09,
@@ -330,35 +347,7 @@ class AudioAnalyzer:
     # ── AUDIO INFO ───────────────────────────────────────────────────────
 
     def _get_audio_info(self, file_path):
-        try:
-            audio = MutagenFile(str(file_path))
-            if audio is None:
-                return self._default_audio_info(file_path)
-            bitrate     = getattr(audio.info, 'bitrate',     0) // 1000
-            sample_rate = getattr(audio.info, 'sample_rate', 44100)
-            channels    = getattr(audio.info, 'channels',    2)
-            duration    = getattr(audio.info, 'length',      0.0)
-            file_size   = round(file_path.stat().st_size / (1024 * 1024), 2)
-            return {
-                'format':       file_path.suffix.upper().replace('.', ''),
-                'bitrate':      bitrate,
-                'sample_rate':  sample_rate,
-                'channels':     channels,
-                'file_size_mb': file_size,
-                'duration':     duration,
-            }
-        except Exception:
-            return self._default_audio_info(file_path)
-
-    def _default_audio_info(self, file_path):
-        return {
-            'format':       file_path.suffix.upper().replace('.', ''),
-            'bitrate':      0,
-            'sample_rate':  44100,
-            'channels':     2,
-            'file_size_mb': round(file_path.stat().st_size / (1024 * 1024), 2),
-            'duration':     0.0,
-        }
+        return read_audio_info(file_path)
 
     # ── SAVE ─────────────────────────────────────────────────────────────
 
@@ -1,40 +1,83 @@
 # analyzer/batch_analyzer.py
 """
 Batch Analyzer — parallel track analysis with JSON result caching.
-Uses ThreadPoolExecutor for concurrent analysis (3 workers).
+Uses a ProcessPoolExecutor (one worker per core, less one for the UI) so the
+pure-Python parts of the analysis are not serialised by the GIL. The pool
+lives until shutdown_pool(), so later runs skip the worker start-up.
 Cache key: MD5 hash of (absolute path + file mtime + file size).
 """
 
 import json
 import hashlib
+import multiprocessing
+import os
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from PyQt6.QtCore import QObject, pyqtSignal
 
-from analyzer.audio_analyzer import AudioAnalyzer
 from paths import get_cache_dir
 
-MAX_WORKERS = 3
+MAX_WORKERS = max(1, (os.cpu_count() or 2) - 1)
 
 
 def _cache_key(file_path: Path) -> str:
     """Stable cache key: md5 of path + mtime + size"""
     stat = file_path.stat()
     key_str = f"{file_path.absolute()}|{stat.st_mtime}|{stat.st_size}"
-    return hashlib.md5(key_str.encode()).hexdigest()
+    return hashlib.md5(key_str.encode(), usedforsecurity=False).hexdigest()
 
 
-def load_cached(file_path: Path) -> dict | None:
-    """Return cached analysis result or None if not cached / stale."""
-    cache_file = get_cache_dir() / f"{_cache_key(file_path)}.json"
-    if cache_file.exists():
-        try:
-            with open(cache_file) as f:
-                return json.load(f)
-        except Exception:
-            cache_file.unlink(missing_ok=True)
-    return None
+# Decoded cache entries by cache file path, so re-scanning an unchanged folder
+# costs a stat per track instead of a file read. Keys embed the track's mtime
+# and size, so an edited track simply misses. Oldest entries are dropped
+# beyond _MEMO_MAX. Entries are shared: callers must not mutate them.
+_MEMO_MAX = 65536
+_memo: dict[str, dict] = {}
+_memo_lock = threading.Lock()
+
+
+def _remember(cache_file: Path, results: dict) -> None:
+    with _memo_lock:
+        _memo[str(cache_file)] = results
+        if len(_memo) > _MEMO_MAX:
+            del _memo[next(iter(_memo))]
+
+
+def cache_listing() -> frozenset[str]:
+    """Names of the files in the cache directory, read in one directory pass."""
+    try:
+        with os.scandir(get_cache_dir()) as it:
+            return frozenset(entry.name for entry in it)
+    except OSError:
+        return frozenset()
+
+
+def load_cached(file_path: Path, listing: frozenset[str] | None = None) -> dict | None:
+    """
+    Return cached analysis result or None if not cached / stale.
+    With a cache_listing() snapshot, tracks missing from it are answered
+    without touching the cache directory (results saved since the snapshot
+    are still found through the memo).
+    """
+    name = f"{_cache_key(file_path)}.json"
+    cache_file = get_cache_dir() / name
+    hit = _memo.get(str(cache_file))
+    if hit is not None:
+        return hit
+    if listing is not None and name not in listing:
+        return None
+    try:
+        with open(cache_file) as f:
+            results = json.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception:
+        cache_file.unlink(missing_ok=True)
+        return None
+    _remember(cache_file, results)
+    return results
 
 
 def save_cached(file_path: Path, results: dict) -> None:
@@ -42,11 +85,68 @@ def save_cached(file_path: Path, results: dict) -> None:
     cache_file = get_cache_dir() / f"{_cache_key(file_path)}.json"
     with open(cache_file, 'w') as f:
         json.dump(results, f)
+    _remember(cache_file, results)
 
 
 def is_cached(file_path: Path) -> bool:
     """Quick check without reading the file."""
-    return (get_cache_dir() / f"{_cache_key(file_path)}.json").exists()
+    cache_file = get_cache_dir() / f"{_cache_key(file_path)}.json"
+    return str(cache_file) in _memo or cache_file.exists()
+
+
+# ── Worker process side ──────────────────────────────────────────────────────
+
+_worker_analyzer = None   # one AudioAnalyzer per worker process
+
+
+def _init_worker() -> None:
+    global _worker_analyzer
+    from analyzer.audio_analyzer import AudioAnalyzer
+    _worker_analyzer = AudioAnalyzer()
+
+
+def _analyze_in_worker(path_str: str) -> tuple:
+    """Runs in a worker process: ('ok', results) or ('error', message)."""
+    try:
+        return 'ok', _worker_analyzer.analyze_track(path_str)
+    except Exception as e:
+        return 'error', str(e)
+
+
+_pool: ProcessPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    """The shared worker pool, started on first use. Workers spawn on demand."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # "spawn" everywhere: forking a process that runs Qt threads is unsafe
+            _pool = ProcessPoolExecutor(
+                max_workers=MAX_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+            )
+        return _pool
+
+
+def _discard_pool(pool: ProcessPoolExecutor) -> None:
+    """Forget a broken pool so the next run starts a fresh one."""
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_pool() -> None:
+    """Stop the worker processes (call on app exit); queued tracks are dropped."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
 
 
 class BatchAnalyzer(QObject):
@@ -100,34 +200,35 @@ class BatchAnalyzer(QObject):
             self.all_done.emit(total - cached_count, cached_count)
             return
 
-        cancel_event = self._cancel_event  # local ref for thread safety
-
-        def _analyze_one(args):
-            idx, path_str = args
-            if cancel_event.is_set():
-                return 'cancelled', path_str, None
-            try:
-                # Fresh analyzer per task — thread-safe, no shared state
-                analyzer = AudioAnalyzer()
-                results = analyzer.analyze_track(path_str)
-                save_cached(Path(path_str), results)
-                return 'ok', path_str, results
-            except Exception as e:
-                return 'error', path_str, str(e)
-
-        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-            futures = {executor.submit(_analyze_one, item): item for item in uncached}
+        executor = _get_pool()
+        futures = {}
+        try:
+            for _, path_str in uncached:
+                futures[executor.submit(_analyze_in_worker, path_str)] = path_str
             for future in as_completed(futures):
-                status, path_str, payload = future.result()
+                path_str = futures[future]
                 completed += 1
+                try:
+                    status, payload = future.result()
+                except BrokenProcessPool as e:
+                    _discard_pool(executor)
+                    status, payload = 'error', f"analysis worker died: {e}"
                 if status == 'ok':
+                    # Cache writes stay in this process so the in-memory memo sees them
+                    try:
+                        save_cached(Path(path_str), payload)
+                    except OSError as e:
+                        print(f"[batch_analyzer] Could not cache {path_str}: {e}")
                     self.track_done.emit(path_str, payload, completed, total)
-                elif status == 'error':
+                else:
                     self.error.emit(path_str, payload)
-                # 'cancelled' — skip silently, no signal needed
                 self.progress.emit(completed, total)
-                if cancel_event.is_set():
+                if self._cancel_event.is_set():
                     break
+        finally:
+            # On cancel, queued tracks are dropped; running ones finish unseen
+            for future in futures:
+                future.cancel()
 
         self.all_done.emit(total - cached_count, cached_count)
 
@@ -0,0 +1,22 @@
+# analyzer/features.py
+"""
+Feature vector layout shared by the analyzer (writer) and similarity search
+(reader). Kept free of heavy imports so worker processes that only analyse
+tracks do not load the similarity search stack.
+"""
+
+import math
+
+import numpy as np
+
+# Bump when the on-disk feature layout changes; entries carrying an older
+# (or no) version are renormalised when loaded.
+FEATURE_NORM_VERSION = 2
+
+
+def l2_normalize(vec: np.ndarray) -> np.ndarray:
+    """Return vec scaled to unit length (zero vectors are returned unchanged)."""
+    sq = float(vec @ vec)
+    if sq < 1e-18:
+        return vec
+    return vec / math.sqrt(sq)
@@ -28,8 +28,6 @@ import urllib.request
 from pathlib import Path
 
 import numpy as np
-from scipy.fft import rfft
-from scipy.signal import get_window
 
 from paths import get_cache_dir, get_models_dir
 
@@ -131,9 +129,11 @@ def _mel_patches(audio: np.ndarray) -> np.ndarray:
       - No per-patch z-score (raw log values passed directly to model)
     """
     global _MEL_FB, _WINDOW
+    from scipy.fft import rfft   # deferred with get_window: keeps module import cheap
     if _MEL_FB is None:
         _MEL_FB = _build_mel_fb()
     if _WINDOW is None:
+        from scipy.signal import get_window
         _WINDOW = get_window("hann", _N_FFT).astype(np.float32)
 
     audio = audio.astype(np.float32)
@@ -223,7 +223,7 @@ def _genre_cache_key(file_path: Path) -> str:
     """Cache key: MD5 of absolute path + mtime + size, prefixed 'genre_'."""
     stat = file_path.stat()
     key_str = f"{file_path.absolute()}|{stat.st_mtime}|{stat.st_size}"
-    return "genre_" + hashlib.md5(key_str.encode()).hexdigest()
+    return "genre_" + hashlib.md5(key_str.encode(), usedforsecurity=False).hexdigest()
 
 
 def load_genre_cache(file_path: Path) -> str | None:
@@ -0,0 +1,36 @@
+# analyzer/quick_probe.py
+"""
+Quick probe — audio format details from the file header, without decoding.
+
+mutagen reads only the container/frame headers, so this costs a few small
+reads per file. The library uses it to show bitrate-dependent flags for
+tracks that have not been analysed yet; AudioAnalyzer uses the same
+function for the 'audio_info' part of a full analysis.
+"""
+
+from pathlib import Path
+
+from mutagen import File as MutagenFile
+
+
+def read_audio_info(file_path: Path) -> dict:
+    """Format, bitrate (kbps), sample rate, channels, size (MB) and duration (s)."""
+    file_path = Path(file_path)
+    info = {
+        'format':       file_path.suffix.upper().replace('.', ''),
+        'bitrate':      0,
+        'sample_rate':  44100,
+        'channels':     2,
+        'file_size_mb': round(file_path.stat().st_size / (1024 * 1024), 2),
+        'duration':     0.0,
+    }
+    try:
+        audio = MutagenFile(str(file_path))
+    except Exception:
+        return info
+    if audio is not None:
+        info['bitrate']     = getattr(audio.info, 'bitrate',     0) // 1000
+        info['sample_rate'] = getattr(audio.info, 'sample_rate', 44100)
+        info['channels']    = getattr(audio.info, 'channels',    2)
+        info['duration']    = getattr(audio.info, 'length',      0.0)
+    return info
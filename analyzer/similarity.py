@@ -4,54 +4,169 @@ analyzer/similarity.py — MFCC+chroma cosine similarity search.
 find_similar(query_fp, candidate_fps, cache_dir, top_n) compares the
 32-dim feature vector of the query track against all cached candidates
 and returns top_n results sorted by cosine similarity descending.
+With compatible_only=True, candidates are first narrowed to those within
+BPM_WINDOW and on a compatible Camelot key, using the BPM/key metadata the
+index already holds, so only DJ-usable tracks are scored.
+
+Feature vectors are L2-normalised when analysis results are written
+(norm_version 2), so cosine similarity reduces to a dot product. Older
+cache entries are normalised on read. Candidates are stacked into one
+(N, 32) float32 matrix and scored in a single batched call — SimSIMD's
+int8 cdist when installed, otherwise one BLAS GEMV (matrix @ query).
+
+Candidate vectors come from the on-disk FeatureIndex (one memory-mapped
+.npy for the whole library), kept in step with the library's cache JSON:
+only new or re-analysed tracks are parsed. Parsed vectors are memoised per
+cache file (keyed on its mtime and size), and the last stacked candidate
+matrix is reused until a cache file or the candidate list changes.
 """
 from __future__ import annotations
 
 import hashlib
 import json
+import math
+import os
+from functools import lru_cache
 from pathlib import Path
 
 import numpy as np
 
+from analyzer.features import FEATURE_NORM_VERSION, l2_normalize
+from analyzer.similarity_index import FeatureIndex
 from paths import get_cache_dir
 
+try:
+    import simsimd   # optional — SIMD kernels dispatched at runtime
+except ImportError:
+    simsimd = None
+
+# Score with int8-quantised vectors when SimSIMD is available (4× less data
+# per candidate, VNNI/NEON dot kernels). Set False to score with the float32
+# BLAS GEMV instead.
+INT8_SCORING = True
+
+# compatible_only prefilter: candidates must sit within this many BPM of the
+# query and on the same or an adjacent Camelot wheel position.
+BPM_WINDOW = 6.0
+
+# Last stacked candidate matrix: (key, fps, matrix, meta). See _candidate_matrix.
+_matrix_cache: tuple | None = None
+# Open FeatureIndex for the cache directory in use (this process is its only writer).
+_feature_index: FeatureIndex | None = None
+
 
 def _cache_key(file_path: str) -> str:
     """Reproduce the same cache key used by batch_analyzer."""
     p = Path(file_path)
-    stat = p.stat()
+    return _key_from_stat(p, p.stat())
+
+
+def _key_from_stat(p: Path, stat) -> str:
     key_str = f"{p.absolute()}|{stat.st_mtime}|{stat.st_size}"
-    return hashlib.md5(key_str.encode()).hexdigest()
+    return hashlib.md5(key_str.encode(), usedforsecurity=False).hexdigest()
 
 
-def _load_feature_vector(file_path: str, cache_dir: Path) -> np.ndarray | None:
-    """Load 32-dim feature vector from cache, or None if unavailable."""
+def _cache_keys(file_paths: list[str]) -> list[tuple[str, str]]:
+    """
+    [(file_path, cache_key), ...] for every file that exists, in input order.
+
+    Files are stat'ed through one os.scandir pass per parent directory
+    (on Windows the DirEntry carries the stat data, so no per-file syscall).
+    Anything the listing does not match exactly falls back to _cache_key.
+    """
+    by_dir: dict[Path, dict[str, os.DirEntry]] = {}
+    out = []
+    for fp in file_paths:
+        p = Path(fp)
+        parent = p.parent
+        if parent not in by_dir:
+            try:
+                with os.scandir(parent) as it:
+                    by_dir[parent] = {e.name: e for e in it}
+            except OSError:
+                by_dir[parent] = {}
+        entry = by_dir[parent].get(p.name)
+        try:
+            key = _key_from_stat(p, entry.stat()) if entry is not None else _cache_key(fp)
+        except OSError:
+            continue
+        out.append((fp, key))
+    return out
+
+
+def _load_cache_entry(file_path: str, cache_dir: Path) -> tuple | None:
+    """Return (vector | None, bpm, camelot) for file_path's cache entry, or None."""
     try:
         cache_file = cache_dir / f"{_cache_key(file_path)}.json"
-        if not cache_file.exists():
-            return None
-        data = json.loads(cache_file.read_text())
-        feats = data.get('features')
-        if not feats:
-            return None
-        mfcc   = feats.get('mfcc', [])
-        chroma = feats.get('chroma', [])
-        if len(mfcc) != 20 or len(chroma) != 12:
-            return None
-        return np.array(mfcc + chroma, dtype=np.float32)
+    except OSError:
+        return None
+    return _parse_cache_entry_file(cache_file)
+
+
+@lru_cache(maxsize=4096)
+def _parse_cache_file(cache_file: str, mtime_ns: int, size: int) -> tuple | None:
+    """Parse one cache JSON. mtime_ns/size only key the memo — a rewrite re-parses."""
+    try:
+        data = json.loads(Path(cache_file).read_text())
+        vec = _vector_from_entry(data)
     except Exception:
         return None
+    if vec is not None:
+        vec.flags.writeable = False   # shared between callers via the memo
+    return vec, data.get('bpm'), data.get('key', {}).get('camelot', '--')
+
+
+def _vector_from_entry(data: dict) -> np.ndarray | None:
+    """Extract the unit-length 32-dim feature vector from a cache entry."""
+    feats = data.get('features')
+    if not feats:
+        return None
+    mfcc   = feats.get('mfcc', [])
+    chroma = feats.get('chroma', [])
+    if len(mfcc) != 20 or len(chroma) != 12:
+        return None
+    vec = np.array(mfcc + chroma, dtype=np.float32)
+    if feats.get('norm_version') != FEATURE_NORM_VERSION:
+        vec = l2_normalize(vec)   # legacy entry written before normalisation
+    return vec
+
+
+def _load_feature_vector(file_path: str, cache_dir: Path) -> np.ndarray | None:
+    """Load unit-length 32-dim feature vector from cache, or None if unavailable."""
+    entry = _load_cache_entry(file_path, cache_dir)
+    return entry[0] if entry is not None else None
 
 
 def _cosine_similarity(a: list | np.ndarray, b: list | np.ndarray) -> float:
     """Cosine similarity between two vectors. Returns float in [-1, 1]."""
-    va = np.asarray(a, dtype=np.float32)
-    vb = np.asarray(b, dtype=np.float32)
-    norm_a = float(np.linalg.norm(va))
-    norm_b = float(np.linalg.norm(vb))
-    if norm_a < 1e-9 or norm_b < 1e-9:
+    va = np.ascontiguousarray(a, dtype=np.float32)
+    vb = np.ascontiguousarray(b, dtype=np.float32)
+    # Three C-level dot products; no per-element Python work or norm() calls
+    sq_a = float(va @ va)
+    sq_b = float(vb @ vb)
+    if sq_a < 1e-18 or sq_b < 1e-18:
         return 0.0
-    return float(np.dot(va, vb) / (norm_a * norm_b))
+    return float(va @ vb) / math.sqrt(sq_a * sq_b)
+
+
+def _quantize_i8(vecs: np.ndarray) -> np.ndarray:
+    """Map unit-length float components in [-1, 1] onto int8."""
+    return np.clip(np.round(vecs * 127.0), -128, 127).astype(np.int8)
+
+
+def _batch_cosine(query: np.ndarray, matrix: np.ndarray) -> np.ndarray:
+    """Cosine similarity of unit-length query (32,) against unit-length rows (N, 32).
+
+    Both sides are already L2-normalised, so in float32 cosine is just
+    matrix @ query — a single BLAS sgemv. The int8 path uses SimSIMD's cosine
+    kernel, which also absorbs the small norm drift introduced by rounding.
+    """
+    if simsimd is not None and INT8_SCORING:
+        dist = simsimd.cdist(_quantize_i8(query)[None, :], _quantize_i8(matrix),
+                             metric='cosine')
+        return (1.0 - np.asarray(dist, dtype=np.float32)).ravel()
+    # Matching float32 C-contiguous operands keep NumPy on cblas_sgemv
+    return np.ascontiguousarray(matrix, dtype=np.float32) @ query.astype(np.float32, copy=False)
 
 
 def find_similar(
@@ -59,10 +174,15 @@ def find_similar(
     candidate_fps: list[str],
     cache_dir: Path | None = None,
     top_n: int = 25,
+    compatible_only: bool = False,
 ) -> list[dict]:
     """
     Return top_n most similar tracks from candidate_fps.
 
+    With compatible_only, candidates outside BPM_WINDOW of the query's BPM or
+    not harmonically compatible with its Camelot key are dropped before any
+    scoring. A query with no BPM or key skips that half of the filter.
+
     Each result dict has keys:
         file_path   str
         name        str   (filename stem)
@@ -73,30 +193,147 @@ def find_similar(
     if cache_dir is None:
         cache_dir = get_cache_dir()
 
-    query_vec = _load_feature_vector(query_fp, cache_dir)
-    if query_vec is None:
+    query = _load_cache_entry(query_fp, cache_dir)
+    if query is None or query[0] is None:
+        return []
+    query_vec, query_bpm, query_camelot = query
+
+    fps, matrix, meta = _candidate_matrix(query_fp, candidate_fps, cache_dir)
+    if compatible_only and fps:
+        keep = [i for i, (bpm, camelot) in enumerate(meta)
+                if _is_compatible(query_bpm, query_camelot, bpm, camelot)]
+        fps    = [fps[i] for i in keep]
+        meta   = [meta[i] for i in keep]
+        matrix = matrix[keep]
+    if not fps or top_n <= 0:
         return []
 
+    sims = _batch_cosine(query_vec, matrix)
+
+    # Partial sort: only the top_n survivors are fully ordered
+    if top_n < len(sims):
+        top = np.argpartition(-sims, top_n)[:top_n]
+    else:
+        top = np.arange(len(sims))
+    top = top[np.argsort(-sims[top], kind='stable')]
+
     results = []
-    for fp in candidate_fps:
-        if fp == query_fp:
-            continue
-        vec = _load_feature_vector(fp, cache_dir)
-        if vec is None:
-            continue
-        sim = _cosine_similarity(query_vec, vec)
-        try:
-            cache_file = cache_dir / f"{_cache_key(fp)}.json"
-            meta = json.loads(cache_file.read_text())
-        except Exception:
-            meta = {}
+    for i in top:
+        bpm, camelot = meta[i]
         results.append({
-            'file_path':  fp,
-            'name':       Path(fp).stem,
-            'similarity': round((sim + 1.0) / 2.0, 4),  # map [-1,1] → [0,1]
-            'bpm':        meta.get('bpm'),
-            'key':        meta.get('key', {}).get('camelot', '--'),
+            'file_path':  fps[i],
+            'name':       Path(fps[i]).stem,
+            'similarity': round((float(sims[i]) + 1.0) / 2.0, 4),  # map [-1,1] → [0,1]
+            'bpm':        bpm,
+            'key':        camelot,
         })
+    return results
+
+
+def _camelot_compatible(a: str, b: str) -> bool:
+    """Same key, relative major/minor (8A↔8B), or ±1 on the wheel in the same mode."""
+    try:
+        num_a, mode_a = int(a[:-1]), a[-1]
+        num_b, mode_b = int(b[:-1]), b[-1]
+    except (ValueError, IndexError, TypeError):
+        return False
+    if num_a == num_b:
+        return True
+    return mode_a == mode_b and (num_a - num_b) % 12 in (1, 11)
+
+
+def _is_compatible(q_bpm, q_camelot: str, bpm, camelot: str) -> bool:
+    """BPM/key prefilter for find_similar(compatible_only=True)."""
+    if q_bpm is not None and (bpm is None or abs(bpm - q_bpm) > BPM_WINDOW):
+        return False
+    if q_camelot and q_camelot != '--' and not _camelot_compatible(q_camelot, camelot):
+        return False
+    return True
+
+
+def _candidate_matrix(
+    query_fp: str,
+    candidate_fps: list[str],
+    cache_dir: Path,
+) -> tuple[list[str], np.ndarray | None, list[tuple]]:
+    """
+    Gather the feature vectors of every analysed candidate into an (N, 32) matrix.
+
+    Returns (file_paths, matrix, [(bpm, camelot), ...]) in matching order.
+    The FeatureIndex is first reconciled with the live cache entries of the
+    candidates (query included): rows for tracks that left the library, lost
+    their cache JSON or were re-analysed since are dropped, missing rows are
+    parsed and appended, and the index is saved only if anything changed.
+    The result is reused while the resolved cache files and their mtimes
+    are unchanged (cache file names encode the audio file's path, mtime and
+    size, so a changed track resolves differently).
+    """
+    global _matrix_cache, _feature_index
+    resolved = _cache_keys(candidate_fps)
+    live = _cache_file_stats(cache_dir, [ck for _, ck in resolved])
+    key = (str(cache_dir), query_fp, tuple(resolved),
+           tuple(live[ck].st_mtime_ns if ck in live else None for _, ck in resolved))
+    if _matrix_cache is not None and _matrix_cache[0] == key:
+        return _matrix_cache[1], _matrix_cache[2], _matrix_cache[3]
+
+    if _feature_index is None or _feature_index.cache_dir != Path(cache_dir):
+        _feature_index = FeatureIndex.load(cache_dir)
+    index = _feature_index
+
+    keep = [r for r, (ck, mtime_ns) in enumerate(zip(index.keys, index.mtimes))
+            if ck in live and live[ck].st_mtime_ns == mtime_ns]
+    changed = len(keep) != len(index.keys)
+    if changed:
+        index.compact(keep)
+
+    # Live entries the index lacks are parsed once and appended in one batch
+    new_entries = []
+    for ck, st in live.items():
+        if index.row(ck) is None:
+            entry = _parse_cache_file(str(cache_dir / f"{ck}.json"), st.st_mtime_ns, st.st_size)
+            if entry is not None and entry[0] is not None:
+                new_entries.append((ck, st.st_mtime_ns, *entry))
+    if new_entries:
+        index.extend(new_entries)
+        changed = True
+    if changed:
+        index.save()
 
-    results.sort(key=lambda r: r['similarity'], reverse=True)
-    return results[:top_n]
+    fps, kept = [], []
+    for fp, ck in resolved:
+        row = index.row(ck)
+        if fp != query_fp and row is not None:
+            fps.append(fp)
+            kept.append(row)
+    matrix = np.asarray(index.matrix[kept], dtype=np.float32) if kept else None
+    meta   = [index.meta[r] for r in kept]
+
+    _matrix_cache = (key, fps, matrix, meta)
+    return fps, matrix, meta
+
+
+def _cache_file_stats(cache_dir: Path, cache_keys: list[str]) -> dict[str, os.stat_result]:
+    """{cache_key: stat of its JSON} for the keys that have one, from one directory listing."""
+    wanted = {f"{ck}.json": ck for ck in cache_keys}
+    out = {}
+    try:
+        with os.scandir(cache_dir) as it:
+            for entry in it:
+                ck = wanted.get(entry.name)
+                if ck is not None:
+                    try:
+                        out[ck] = entry.stat()
+                    except OSError:
+                        pass
+    except OSError:
+        pass
+    return out
+
+
+def _parse_cache_entry_file(cache_file: Path) -> tuple | None:
+    """Memoised parse of cache_file, or None if it does not exist."""
+    try:
+        st = cache_file.stat()
+    except OSError:
+        return None
+    return _parse_cache_file(str(cache_file), st.st_mtime_ns, st.st_size)
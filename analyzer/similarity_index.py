@@ -0,0 +1,104 @@
+"""
+analyzer/similarity_index.py — on-disk feature matrix for similarity search.
+
+Every analysed track's unit-length 32-dim feature vector lives in one
+float32 .npy file (opened memory-mapped), with a small JSON sidecar that
+holds the per-row cache key, cache-file mtime, BPM and Camelot key. Loading
+the catalogue is then one np.load instead of a json.loads per track.
+
+Rows are keyed by the batch-analyzer cache key (md5 of path + mtime + size),
+so a re-encoded or replaced audio file simply resolves to a new row. The
+per-track JSON cache stays the source of truth: when the library's live
+cache entries differ from the indexed ones, find_similar compacts the index
+to them (dropping removed tracks and rows older than their JSON), appends
+the missing rows and saves once. An unchanged library never rewrites it.
+"""
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+
+MATRIX_FILE = "features.f32.npy"
+INDEX_FILE  = "features_index.json"
+N_DIMS      = 32
+
+
+class FeatureIndex:
+    """(N, 32) float32 feature matrix plus per-row cache key and metadata."""
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = Path(cache_dir)
+        self.matrix: np.ndarray = np.empty((0, N_DIMS), dtype=np.float32)
+        self.keys: list[str] = []
+        self.mtimes: list[int] = []          # cache JSON st_mtime_ns each row was read from
+        self.meta: list[tuple] = []          # (bpm, camelot) per row
+        self._row_of: dict[str, int] = {}
+
+    @classmethod
+    def load(cls, cache_dir: Path) -> "FeatureIndex":
+        """Open the saved index (memory-mapped); empty index if absent or corrupt."""
+        index = cls(cache_dir)
+        try:
+            with open(index.cache_dir / INDEX_FILE) as f:
+                data = json.load(f)
+            keys, mtimes, meta = data['keys'], data['mtimes'], data['meta']
+            matrix = np.load(index.cache_dir / MATRIX_FILE, mmap_mode='r')
+            if (matrix.shape != (len(keys), N_DIMS)
+                    or len(meta) != len(keys) or len(mtimes) != len(keys)):
+                raise ValueError("feature index out of sync")
+        except (OSError, ValueError, KeyError, TypeError):
+            return index
+        index.matrix = matrix
+        index.keys = list(keys)
+        index.mtimes = list(mtimes)
+        index.meta = [tuple(m) for m in meta]
+        index._row_of = {k: i for i, k in enumerate(index.keys)}
+        return index
+
+    def row(self, cache_key: str) -> int | None:
+        """Row number for cache_key, or None if the track is not indexed."""
+        return self._row_of.get(cache_key)
+
+    def compact(self, keep: list[int]) -> None:
+        """Keep only the given rows (in that order), renumbering them from 0."""
+        self.matrix = np.array(self.matrix[keep], dtype=np.float32).reshape(-1, N_DIMS)
+        self.keys   = [self.keys[r] for r in keep]
+        self.mtimes = [self.mtimes[r] for r in keep]
+        self.meta   = [self.meta[r] for r in keep]
+        self._row_of = {k: i for i, k in enumerate(self.keys)}
+
+    def extend(self, entries: list[tuple]) -> int:
+        """
+        Append (cache_key, mtime_ns, vector, bpm, camelot) rows; return the
+        first new row. The matrix is rebuilt once per call, so callers should batch.
+        """
+        first = len(self.keys)
+        if not entries:
+            return first
+        vecs = np.stack([e[2] for e in entries]).astype(np.float32)
+        # Copying into RAM also releases the memory map before save() replaces the file
+        self.matrix = np.concatenate([np.asarray(self.matrix), vecs])
+        for i, (key, mtime_ns, _, bpm, camelot) in enumerate(entries, start=first):
+            self.keys.append(key)
+            self.mtimes.append(mtime_ns)
+            self.meta.append((bpm, camelot))
+            self._row_of[key] = i
+        return first
+
+    def save(self) -> None:
+        """Write matrix and sidecar via temp file + os.replace."""
+        try:
+            tmp = self.cache_dir / (MATRIX_FILE + ".tmp")
+            with open(tmp, 'wb') as f:
+                np.save(f, np.ascontiguousarray(self.matrix, dtype=np.float32))
+            os.replace(tmp, self.cache_dir / MATRIX_FILE)
+
+            tmp = self.cache_dir / (INDEX_FILE + ".tmp")
+            with open(tmp, 'w') as f:
+                json.dump({'keys': self.keys, 'mtimes': self.mtimes, 'meta': self.meta}, f)
+            os.replace(tmp, self.cache_dir / INDEX_FILE)
+        except OSError as exc:
+            print(f"[similarity_index] Could not save feature index: {exc}")
@@ -22,14 +22,13 @@ Sync state is stored in get_data_dir() / 'sync_state.json' as:
 from __future__ import annotations
 
 import json
-import sys
+import time
 from pathlib import Path
 
 from PyQt6.QtCore import QThread, pyqtSignal
 
 import yt_dlp
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
 from paths import get_data_dir
 
 
@@ -997,16 +996,22 @@ class PlaylistSyncWorker(QThread):
     Signals
     -------
     new_track(dict)          — {title, artist?, url, source_id, source_label}
+    new_tracks_batch(list)   — the same dicts, coalesced (up to BATCH_SIZE per
+                               emit, at least every BATCH_INTERVAL seconds)
     track_not_found(dict)    — {title, artist, source_id, source_label}
     source_done(str, int)    — source_id, count of new tracks found
     all_done()
     """
 
-    new_track       = pyqtSignal(dict)
-    track_not_found = pyqtSignal(dict)
-    source_done     = pyqtSignal(str, int)
-    source_error    = pyqtSignal(str, str)   # source_id, error_message
-    all_done        = pyqtSignal()
+    new_track        = pyqtSignal(dict)
+    new_tracks_batch = pyqtSignal(list)
+    track_not_found  = pyqtSignal(dict)
+    source_done      = pyqtSignal(str, int)
+    source_error     = pyqtSignal(str, str)   # source_id, error_message
+    all_done         = pyqtSignal()
+
+    BATCH_SIZE     = 32
+    BATCH_INTERVAL = 0.1   # seconds
 
     def __init__(
         self,
@@ -1018,6 +1023,8 @@ class PlaylistSyncWorker(QThread):
         self._sources = sources
         self._known = known_state
         self._new_state: dict = {k: list(v) for k, v in known_state.items()}
+        self._batch: list[dict] = []
+        self._batch_started: float = 0.0
 
     def run(self) -> None:
         for source in self._sources:
@@ -1045,7 +1052,7 @@ class PlaylistSyncWorker(QThread):
                         t["url"] = url
                         t["source_id"] = source.source_id
                         t["source_label"] = getattr(source, "label", source.source_id)
-                        self.new_track.emit(dict(t))
+                        self._emit_new_track(dict(t))
                         new_count += 1
                     else:
                         t["source_id"] = source.source_id
@@ -1054,14 +1061,30 @@ class PlaylistSyncWorker(QThread):
                 else:
                     t["source_id"] = source.source_id
                     t["source_label"] = getattr(source, "label", source.source_id)
-                    self.new_track.emit(dict(t))
+                    self._emit_new_track(dict(t))
                     new_count += 1
 
+            self._flush_batch()
             self.source_done.emit(source.source_id, new_count)
 
         save_sync_state(self._new_state)
         self.all_done.emit()
 
+    def _emit_new_track(self, track: dict) -> None:
+        """Emit new_track and add the track to the pending batch."""
+        self.new_track.emit(track)
+        if not self._batch:
+            self._batch_started = time.monotonic()
+        self._batch.append(track)
+        if (len(self._batch) >= self.BATCH_SIZE
+                or time.monotonic() - self._batch_started >= self.BATCH_INTERVAL):
+            self._flush_batch()
+
+    def _flush_batch(self) -> None:
+        if self._batch:
+            batch, self._batch = self._batch, []
+            self.new_tracks_batch.emit(batch)
+
     # ------------------------------------------------------------------
 
     def _known_ids_for(self, source_id: str) -> set:
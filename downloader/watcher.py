@@ -1,20 +1,60 @@
 """
 SoulSeek folder watcher using watchdog.
-Emits a Qt signal whenever a new audio file appears in the watched directory.
+Emits a Qt signal whenever a new audio file appears in the watched directory,
+carrying the file's size (stat'ed on the observer thread, not the UI thread).
 Handles both direct creation (on_created) and rename-on-completion
 (on_moved) — SoulSeek typically saves as .tmp and renames when finished.
+
+Uses the native observer (inotify / ReadDirectoryChangesW / FSEvents). Network
+shares don't deliver native events for remote writes, so those — and any
+folder the native backend refuses (e.g. inotify watch limit) — are polled.
 """
 
 from __future__ import annotations
 
+import os
+import sys
 from pathlib import Path
 
 from PyQt6.QtCore import QObject, pyqtSignal
 from watchdog.events import FileSystemEventHandler
 from watchdog.observers import Observer
+from watchdog.observers.polling import PollingObserver
+
+
+AUDIO_EXTS = frozenset({".mp3", ".wav", ".flac", ".m4a", ".ogg", ".aiff", ".aif", ".opus", ".webm"})
+_AUDIO_SUFFIXES = tuple(AUDIO_EXTS)   # for str.endswith
+
+# Seconds between directory snapshots when the folder has to be polled
+POLL_INTERVAL = 10.0
 
+_NETWORK_FS_TYPES = {"nfs", "nfs4", "cifs", "smbfs", "smb3", "fuse.sshfs", "9p"}
 
-AUDIO_EXTS = {".mp3", ".wav", ".flac", ".m4a", ".ogg", ".aiff", ".aif", ".opus", ".webm"}
+
+def _is_network_path(path: Path) -> bool:
+    """Best-effort check for a folder on a network share."""
+    s = str(path)
+    if s.startswith(("\\\\", "//")):   # UNC path
+        return True
+    if sys.platform == "win32":
+        import ctypes
+        drive = os.path.splitdrive(os.path.abspath(s))[0]
+        DRIVE_REMOTE = 4
+        return bool(drive) and ctypes.windll.kernel32.GetDriveTypeW(drive + "\\") == DRIVE_REMOTE
+    try:
+        with open("/proc/mounts") as f:
+            mounts = [line.split()[1:3] for line in f]
+    except OSError:
+        return False
+    # The longest mount point containing the folder decides its filesystem
+    target = os.path.realpath(s)
+    best, best_type = "", ""
+    for mount_point, fs_type in mounts:
+        mount_point = mount_point.replace("\\040", " ")
+        if ((target == mount_point or target.startswith(mount_point.rstrip("/") + "/"))
+                and len(mount_point) > len(best)):
+            best, best_type = mount_point, fs_type
+    return best_type in _NETWORK_FS_TYPES
 
 
 class _AudioHandler(FileSystemEventHandler):
@@ -26,16 +66,20 @@ class _AudioHandler(FileSystemEventHandler):
 
     def on_created(self, event) -> None:
         if not event.is_directory:
-            path = Path(event.src_path)
-            if path.suffix.lower() in AUDIO_EXTS:
-                self._cb(str(path))
+            self._forward(event.src_path)
 
     def on_moved(self, event) -> None:
         """Catches SoulSeek's .tmp → final-filename rename on download completion."""
         if not event.is_directory:
-            path = Path(event.dest_path)
-            if path.suffix.lower() in AUDIO_EXTS:
-                self._cb(str(path))
+            self._forward(event.dest_path)
+
+    def _forward(self, src: str) -> None:
+        if src.lower().endswith(_AUDIO_SUFFIXES):
+            try:
+                size = os.stat(src).st_size
+            except OSError:
+                size = 0
+            self._cb(src, size)
 
 
 class FolderWatcher(QObject):
@@ -51,11 +95,11 @@ class FolderWatcher(QObject):
     watcher.stop()
     """
 
-    file_detected = pyqtSignal(str)   # absolute path of the detected audio file
+    file_detected = pyqtSignal(str, "qint64")   # absolute path, size in bytes
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self._observer: Observer | None = None
+        self._observer: Observer | PollingObserver | None = None
 
     # ------------------------------------------------------------------
     # Public API
@@ -72,12 +116,23 @@ class FolderWatcher(QObject):
         if not path.exists():
             return False
 
-        handler = _AudioHandler(lambda fp: self.file_detected.emit(fp))
-        self._observer = Observer()
-        self._observer.schedule(handler, str(path), recursive=True)
-        self._observer.start()
+        handler = _AudioHandler(self.file_detected.emit)
+        if not _is_network_path(path):
+            try:
+                self._observer = self._start_observer(Observer(), handler, path)
+                return True
+            except OSError as exc:
+                print(f"[watcher] Native watch failed ({exc}); polling instead")
+        self._observer = self._start_observer(
+            PollingObserver(timeout=POLL_INTERVAL), handler, path)
         return True
 
+    @staticmethod
+    def _start_observer(observer, handler, path: Path):
+        observer.schedule(handler, str(path), recursive=True)
+        observer.start()
+        return observer
+
     def stop(self) -> None:
         """Stop watching and join the observer thread."""
         if self._observer is not None:
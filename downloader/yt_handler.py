@@ -12,6 +12,7 @@ to DownloadWorker if you want to override.
 from __future__ import annotations
 
 import glob
+import os
 import shutil
 from pathlib import Path
 
@@ -19,6 +20,9 @@ from PyQt6.QtCore import QThread, pyqtSignal
 
 import yt_dlp
 
+# Audio files yt-dlp may leave in the output folder (checked with str.endswith)
+_AUDIO_SUFFIXES = (".mp3", ".m4a", ".webm", ".ogg", ".opus", ".wav", ".flac")
+
 
 # ---------------------------------------------------------------------------
 # ffmpeg detection
@@ -62,6 +66,22 @@ def find_ffmpeg() -> str | None:
     return None
 
 
+class FfmpegProbe(QThread):
+    """
+    Runs find_ffmpeg() in a background thread — the Program Files globs can
+    take a noticeable time on a cold disk.
+
+    Signals
+    -------
+    found(path)  — ffmpeg path string, or None if not found
+    """
+
+    found = pyqtSignal(object)
+
+    def run(self) -> None:
+        self.found.emit(find_ffmpeg())
+
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -184,11 +204,11 @@ class DownloadWorker(QThread):
 
     def _find_recent_audio(self) -> str | None:
         """Glob output_dir for the most recently written audio file."""
-        audio_exts = {".mp3", ".m4a", ".webm", ".ogg", ".opus", ".wav", ".flac"}
-        candidates = [
-            p for p in self.output_dir.iterdir()
-            if p.suffix.lower() in audio_exts
-        ]
-        if not candidates:
-            return None
-        return str(max(candidates, key=lambda p: p.stat().st_mtime))
+        newest, newest_mtime = None, None
+        with os.scandir(self.output_dir) as it:
+            for entry in it:
+                if entry.name.lower().endswith(_AUDIO_SUFFIXES):
+                    mtime = entry.stat().st_mtime
+                    if newest_mtime is None or mtime > newest_mtime:
+                        newest, newest_mtime = entry.path, mtime
+        return newest
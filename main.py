@@ -3,9 +3,15 @@ TrackFlow - Main Entry Point
 Launch the desktop application
 """
 
+import multiprocessing
 import os
 import sys
 
+# Batch analysis runs in spawned worker processes. In the frozen exe each
+# worker re-launches this executable and must be handed off here, before the
+# log redirect and app setup below.
+multiprocessing.freeze_support()
+
 # When frozen (no console window), redirect stdout/stderr to a log file so
 # errors are not silently lost.  The log lands next to all other user data.
 if getattr(sys, 'frozen', False):
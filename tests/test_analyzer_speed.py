@@ -86,6 +86,25 @@ def test_waveform_n_bars_increased():
     from ui.waveform_dj import WaveformDataThread
     assert WaveformDataThread.N_BARS >= 1200
 
+def test_waveform_bars_cache_roundtrip(tmp_path, monkeypatch):
+    """Cached bars are int16 on disk and reload within one quantization step."""
+    import numpy as np
+    import paths
+    from ui.waveform_dj import load_cached_bars, save_cached_bars
+    monkeypatch.setattr(paths, 'get_cache_dir', lambda: tmp_path)
+    track = tmp_path / 'track.mp3'
+    track.write_bytes(b'\0' * 16)
+
+    assert load_cached_bars(str(track), 100) is None
+    bars = np.random.default_rng(0).random((100, 4), dtype=np.float32)
+    save_cached_bars(str(track), bars)
+    (peaks,) = tmp_path.glob('*.peaks')
+    assert peaks.stat().st_size == 100 * 4 * 2
+    loaded = load_cached_bars(str(track), 100)
+    assert loaded.dtype == np.float32 and loaded.shape == (100, 4)
+    assert np.abs(loaded - bars).max() < 1e-4
+    assert load_cached_bars(str(track), 200) is None
+
 def test_loop_bar_snap_calculation():
     """Bar snap must correctly compute A/B positions from BPM."""
     bpm = 128.0
@@ -243,3 +262,19 @@ def test_mfcc_shape_no_audio():
     mfcc = analyzer._compute_mfcc(S_power, analyzer.sample_rate, n_mfcc=20)
     assert len(mfcc) == 20
     assert all(isinstance(v, float) for v in mfcc)
+
+def test_quick_probe_reads_header_info(tmp_path):
+    """read_audio_info must report format, bitrate and duration without decoding."""
+    import numpy as np
+    import soundfile as sf
+    from analyzer.quick_probe import read_audio_info
+    wav = tmp_path / 'tone.wav'
+    sf.write(wav, np.zeros(8000 * 2, dtype=np.float32), 8000, subtype='PCM_16')
+    info = read_audio_info(wav)
+    assert info['format'] == 'WAV'
+    assert info['bitrate'] == 128          # 8 kHz × 16 bit mono
+    assert abs(info['duration'] - 2.0) < 0.01
+
+    junk = tmp_path / 'junk.mp3'
+    junk.write_bytes(b'not audio')
+    assert read_audio_info(junk)['bitrate'] == 0
@@ -1,11 +1,20 @@
 """Tests for batch_analyzer cache functions"""
 import pytest
 from pathlib import Path
-from analyzer.batch_analyzer import _cache_key, load_cached, save_cached, is_cached
-from paths import get_cache_dir
+from analyzer.batch_analyzer import _cache_key, cache_listing, load_cached, save_cached, is_cached
 
 SAMPLE_TRACK = r"C:\Users\ashay\Downloads\y2mate.com - LudoWic  MIND PARADE Katana ZERO DLC_320kbps.mp3"
 
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Point the batch analyzer cache at a per-test directory."""
+    import analyzer.batch_analyzer as ba
+    d = tmp_path / "cache"
+    d.mkdir()
+    monkeypatch.setattr(ba, "get_cache_dir", lambda: d)
+    return d
+
 @pytest.mark.skipif(not Path(SAMPLE_TRACK).exists(), reason="Sample track not found")
 def test_cache_roundtrip():
     """Cache write → read roundtrip works correctly"""
@@ -19,40 +28,52 @@ def test_cache_roundtrip():
     assert loaded is not None
     assert loaded['bpm'] == 103.4
 
-    # Clean up
-    cache_file = get_cache_dir() / f"{_cache_key(fp)}.json"
-    cache_file.unlink(missing_ok=True)
-    assert not is_cached(fp)
-
 def test_missing_file_not_cached(tmp_path):
     """Newly created empty file is not cached"""
     fake = tmp_path / "nonexistent.mp3"
     fake.touch()
     assert not is_cached(fake)
 
-def test_cache_key_stability():
+def test_cache_key_stability(tmp_path):
     """Same file always produces same cache key"""
-    import tempfile, os
-    with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as f:
-        f.write(b'fake')
-        path = Path(f.name)
-    try:
-        key1 = _cache_key(path)
-        key2 = _cache_key(path)
-        assert key1 == key2
-        assert len(key1) == 32  # MD5 hex length
-    finally:
-        os.unlink(path)
-
-def test_load_cached_handles_corrupt_json(tmp_path):
+    path = tmp_path / "fake.mp3"
+    path.write_bytes(b'fake')
+    key1 = _cache_key(path)
+    key2 = _cache_key(path)
+    assert key1 == key2
+    assert len(key1) == 32  # MD5 hex length
+
+def test_load_cached_handles_corrupt_json(tmp_path, cache_dir):
     """load_cached returns None and removes corrupt cache file"""
     fp = tmp_path / "song.mp3"
     fp.touch()
     # Write corrupt JSON to cache location
-    cache_dir = get_cache_dir()
-    cache_dir.mkdir(parents=True, exist_ok=True)
     cache_file = cache_dir / f"{_cache_key(fp)}.json"
     cache_file.write_text("{{INVALID JSON")
     result = load_cached(fp)
     assert result is None
     assert not cache_file.exists()  # should be cleaned up
+
+def test_load_cached_memoises_until_track_changes(tmp_path, cache_dir):
+    """Repeat lookups skip the cache file; an edited track misses the memo"""
+    fp = tmp_path / "song.mp3"
+    fp.write_bytes(b'one')
+    save_cached(fp, {'bpm': 124.0})
+    (cache_dir / f"{_cache_key(fp)}.json").unlink()
+    assert load_cached(fp) == {'bpm': 124.0}   # served from memory
+    assert is_cached(fp)
+
+    fp.write_bytes(b'longer')
+    assert load_cached(fp) is None
+
+def test_load_cached_with_listing_skips_unlisted(tmp_path, cache_dir):
+    """A listing snapshot answers misses; listed entries are read normally"""
+    cached, fresh = tmp_path / "a.mp3", tmp_path / "b.mp3"
+    cached.write_bytes(b'a')
+    fresh.write_bytes(b'b')
+    (cache_dir / f"{_cache_key(cached)}.json").write_text('{"bpm": 128.0}')
+    listing = cache_listing()
+    assert load_cached(cached, listing) == {'bpm': 128.0}
+    assert load_cached(fresh, listing) is None
+    save_cached(fresh, {'bpm': 90.0})
+    assert load_cached(fresh, listing) == {'bpm': 90.0}   # saved after the snapshot
@@ -160,6 +160,29 @@ def test_folder_watcher_is_watching_property(tmp_path):
     assert not watcher.is_watching
 
 
+def test_folder_watcher_polls_network_folders(tmp_path, monkeypatch):
+    """Folders on a network share must be polled — native events miss remote writes."""
+    import downloader.watcher as watcher_mod
+    from watchdog.observers.polling import PollingObserver
+    monkeypatch.setattr(watcher_mod, "_is_network_path", lambda path: True)
+    monkeypatch.setattr(watcher_mod, "POLL_INTERVAL", 0.1)
+    detected = []
+    watcher = _make_direct_watcher(detected)
+    assert watcher.start(str(tmp_path))
+    assert isinstance(watcher._observer, PollingObserver)
+    (tmp_path / "remote.mp3").write_bytes(b"fake")
+    time.sleep(0.6)
+    watcher.stop()
+    assert any("remote.mp3" in p for p in detected)
+
+
+def test_is_network_path_local_tmp(tmp_path):
+    """A local temp folder is not a network share."""
+    from downloader.watcher import _is_network_path
+    assert not _is_network_path(tmp_path)
+    assert _is_network_path(Path("//server/share/music"))
+
+
 # ---------------------------------------------------------------------------
 # playlist_sync — AppleMusicSource (plist parsing, no network)
 # ---------------------------------------------------------------------------
@@ -357,3 +380,26 @@ def test_main_window_imports_with_downloads_tab():
     """MainWindow must import cleanly after the Downloads tab integration."""
     from ui.main_window import MainWindow
     assert MainWindow is not None
+
+
+def test_sync_worker_batches_new_tracks(tmp_path, monkeypatch):
+    """new_tracks_batch must deliver every new track, BATCH_SIZE at most per emit."""
+    import downloader.playlist_sync as ps
+    monkeypatch.setattr(ps, "SYNC_STATE_FILE", tmp_path / "sync_state.json")
+
+    class _Source:
+        source_id = "PLbatch"
+        label = "Batch"
+        def get_tracks(self):
+            return [{"id": f"v{i}", "title": f"T{i}", "url": f"https://yt/{i}"}
+                    for i in range(70)]
+
+    worker = ps.PlaylistSyncWorker([_Source()], {"PLbatch": ["v0"]})
+    batches, singles = [], []
+    worker.new_tracks_batch.connect(batches.append)
+    worker.new_track.connect(singles.append)
+    worker.run()   # synchronously, so signals are delivered directly
+
+    assert all(len(b) <= ps.PlaylistSyncWorker.BATCH_SIZE for b in batches)
+    assert [t["id"] for b in batches for t in b] == [f"v{i}" for i in range(1, 70)]
+    assert [t["id"] for t in singles] == [f"v{i}" for i in range(1, 70)]
@@ -8,9 +8,14 @@ from unittest.mock import patch
 from analyzer.similarity import find_similar, _cosine_similarity, _load_feature_vector
 
 
+def _fake_key(fp):
+    """Cache key for fp under the mocked stat (mtime 1000.0, size 1000)."""
+    return hashlib.md5(f"{fp}|1000.0|1000".encode(), usedforsecurity=False).hexdigest()
+
+
 def _make_cache(tmp_path, fp, mfcc, chroma, bpm=120.0, camelot='8B'):
     """Write a fake cache JSON for a fake file path using the same key formula."""
-    key = hashlib.md5(f"{fp}|1000.0|1000".encode()).hexdigest()
+    key = _fake_key(fp)
     data = {
         'file_path': fp,
         'filename': Path(fp).name,
@@ -65,7 +70,7 @@ def test_find_similar_skips_no_features(tmp_path):
         mock_stat.return_value.st_size  = 1000
         _make_cache(tmp_path, fp_query, mfcc, chroma)
         # Write cache WITHOUT features
-        key = hashlib.md5(f"{fp_nofeat}|1000.0|1000".encode()).hexdigest()
+        key = _fake_key(fp_nofeat)
         no_feat = {'file_path': fp_nofeat, 'filename': 'nofeat.mp3',
                    'bpm': 120.0, 'key': {'camelot': '8B'}}
         (tmp_path / f"{key}.json").write_text(json.dumps(no_feat))
@@ -98,3 +103,190 @@ def test_find_similar_returns_sorted(tmp_path):
     assert len(results) == 2
     assert results[0]['file_path'] == fp_close
     assert results[0]['similarity'] > results[1]['similarity']
+
+
+def test_find_similar_top_n_matches_scalar_ranking(tmp_path):
+    """Batched scoring must agree with _cosine_similarity and honour top_n."""
+    rng = np.random.default_rng(0)
+    fp_q = str(tmp_path / "query.mp3")
+    q_mfcc, q_chroma = rng.normal(size=20).tolist(), rng.random(12).tolist()
+    others = {}
+
+    with patch('pathlib.Path.stat') as mock_stat:
+        mock_stat.return_value.st_mtime = 1000.0
+        mock_stat.return_value.st_size  = 1000
+        _make_cache(tmp_path, fp_q, q_mfcc, q_chroma)
+        for i in range(10):
+            fp = str(tmp_path / f"t{i}.mp3")
+            mfcc, chroma = rng.normal(size=20).tolist(), rng.random(12).tolist()
+            _make_cache(tmp_path, fp, mfcc, chroma)
+            others[fp] = _cosine_similarity(q_mfcc + q_chroma, mfcc + chroma)
+        results = find_similar(fp_q, [fp_q, *others], tmp_path, top_n=3)
+
+    expected = sorted(others, key=others.get, reverse=True)[:3]
+    assert [r['file_path'] for r in results] == expected
+    for r in results:
+        # int8 scoring (when simsimd is installed) carries ~1% quantisation error
+        assert abs(r['similarity'] - (others[r['file_path']] + 1.0) / 2.0) < 1e-2
+
+
+def test_normalized_and_legacy_entries_score_alike(tmp_path):
+    """A v2 (pre-normalised) entry must load identically to its legacy twin."""
+    from analyzer.audio_analyzer import AudioAnalyzer
+    mfcc   = [float(i) for i in range(20)]
+    chroma = [float(i) for i in range(12)]
+    feats = AudioAnalyzer._build_features(mfcc, chroma)
+    assert feats['norm_version'] == 2
+    assert abs(np.linalg.norm(feats['mfcc'] + feats['chroma']) - 1.0) < 1e-6
+
+    fp_legacy = str(tmp_path / "legacy.mp3")
+    fp_v2     = str(tmp_path / "v2.mp3")
+    with patch('pathlib.Path.stat') as mock_stat:
+        mock_stat.return_value.st_mtime = 1000.0
+        mock_stat.return_value.st_size  = 1000
+        _make_cache(tmp_path, fp_legacy, mfcc, chroma)
+        _make_cache(tmp_path, fp_v2, feats['mfcc'], feats['chroma'])
+        key = _fake_key(fp_v2)
+        data = json.loads((tmp_path / f"{key}.json").read_text())
+        data['features']['norm_version'] = 2
+        (tmp_path / f"{key}.json").write_text(json.dumps(data))
+        v_legacy = _load_feature_vector(fp_legacy, tmp_path)
+        v_v2     = _load_feature_vector(fp_v2, tmp_path)
+
+    assert np.allclose(v_legacy, v_v2, atol=1e-6)
+
+
+def test_quantize_i8_preserves_ranking():
+    """int8 quantisation must keep cosine ranking of unit vectors intact."""
+    from analyzer.similarity import _quantize_i8, l2_normalize
+    rng = np.random.default_rng(1)
+    q = l2_normalize(rng.normal(size=32).astype(np.float32))
+    m = np.stack([l2_normalize(v) for v in rng.normal(size=(50, 32)).astype(np.float32)])
+    qi, mi = _quantize_i8(q).astype(np.int32), _quantize_i8(m).astype(np.int32)
+    approx = (mi @ qi) / (np.linalg.norm(mi, axis=1) * np.linalg.norm(qi))
+    assert np.max(np.abs(approx - m @ q)) < 0.02
+    assert list(np.argsort(-approx)[:5]) == list(np.argsort(-(m @ q))[:5])
+
+
+def test_find_similar_reuses_parsed_entries(tmp_path):
+    """A repeat query must be served without re-parsing any cache JSON."""
+    fp_q = str(tmp_path / "query.mp3")
+    fp_o = str(tmp_path / "other.mp3")
+    with patch('pathlib.Path.stat') as mock_stat:
+        mock_stat.return_value.st_mtime = 1000.0
+        mock_stat.return_value.st_size  = 1000
+        _make_cache(tmp_path, fp_q, [1.0] * 20, [1.0] * 12)
+        _make_cache(tmp_path, fp_o, [1.0] * 20, [0.5] * 12)
+        first = find_similar(fp_q, [fp_q, fp_o], tmp_path, top_n=5)
+        with patch('analyzer.similarity.json.loads', side_effect=AssertionError):
+            second = find_similar(fp_q, [fp_q, fp_o], tmp_path, top_n=5)
+    assert first == second and len(first) == 1
+
+
+def test_find_similar_persists_feature_index(tmp_path):
+    """Candidates are indexed on disk, so a fresh process only parses the query JSON."""
+    import analyzer.similarity as sim
+    from analyzer.similarity_index import FeatureIndex
+    fps = [str(tmp_path / f"t{i}.mp3") for i in range(4)]
+    with patch('pathlib.Path.stat') as mock_stat:
+        mock_stat.return_value.st_mtime = 1000.0
+        mock_stat.return_value.st_size  = 1000
+        for i, fp in enumerate(fps):
+            _make_cache(tmp_path, fp, [float(i + 1)] * 20, [1.0] * 12, bpm=120.0 + i)
+        first = find_similar(fps[0], fps, tmp_path, top_n=5)
+
+    index = FeatureIndex.load(tmp_path)
+    assert index.matrix.shape == (4, 32) and len(index.keys) == 4   # query indexed too
+
+    sim._matrix_cache = None
+    sim._feature_index = None
+    sim._parse_cache_file.cache_clear()
+    with patch('pathlib.Path.stat') as mock_stat, \
+         patch('analyzer.similarity._parse_cache_entry_file',
+               wraps=sim._parse_cache_entry_file) as parse:
+        mock_stat.return_value.st_mtime = 1000.0
+        mock_stat.return_value.st_size  = 1000
+        second = find_similar(fps[0], fps, tmp_path, top_n=5)
+    assert parse.call_count == 1
+    assert first == second and [r['bpm'] for r in second] == [121.0, 122.0, 123.0]
+
+
+def test_feature_index_follows_library_and_reanalysis(tmp_path):
+    """Rows for removed tracks are pruned; a re-analysed track is re-read, not served stale."""
+    import os
+    from analyzer.similarity_index import FeatureIndex
+    fps = [str(tmp_path / f"t{i}.mp3") for i in range(4)]
+    with patch('pathlib.Path.stat') as mock_stat:
+        mock_stat.return_value.st_mtime = 1000.0
+        mock_stat.return_value.st_size  = 1000
+        for i, fp in enumerate(fps):
+            _make_cache(tmp_path, fp, [1.0] * 20, [1.0] * 12, bpm=120.0 + i)
+        find_similar(fps[0], fps, tmp_path, top_n=5)
+
+        # t3 leaves the library; t1 is re-analysed with a new BPM
+        cache_file = tmp_path / f"{_fake_key(fps[1])}.json"
+        _make_cache(tmp_path, fps[1], [1.0] * 20, [1.0] * 12, bpm=99.0)
+        st = os.stat(cache_file)
+        os.utime(cache_file, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        results = find_similar(fps[0], fps[:3], tmp_path, top_n=5)
+
+    assert sorted(r['bpm'] for r in results) == [99.0, 122.0]
+    index = FeatureIndex.load(tmp_path)
+    assert len(index.keys) == 3 and index.row(_fake_key(fps[3])) is None
+
+
+def test_batch_cosine_gemv_matches_scalar():
+    """With int8 scoring off, batched scores are the float32 GEMV of the unit vectors."""
+    import analyzer.similarity as sim
+    rng = np.random.default_rng(1)
+    m = rng.standard_normal((50, 32)).astype(np.float32)
+    m /= np.linalg.norm(m, axis=1, keepdims=True)
+    q = m[0]
+    with patch.object(sim, 'INT8_SCORING', False):
+        sims = sim._batch_cosine(q, m)
+    assert sims.dtype == np.float32
+    expected = [_cosine_similarity(q, row) for row in m]
+    assert np.allclose(sims, expected, atol=1e-5)
+
+
+def test_find_similar_compatible_only_filters_bpm_and_key(tmp_path):
+    """compatible_only keeps tracks within BPM_WINDOW on an adjacent Camelot key."""
+    cases = {
+        'same.mp3':     (122.0, '8A'),
+        'relative.mp3': (118.0, '8B'),
+        'adjacent.mp3': (120.0, '9A'),
+        'below.mp3':    (120.0, '7A'),
+        'far_key.mp3':  (120.0, '3A'),
+        'far_bpm.mp3':  (140.0, '8A'),
+        'cross.mp3':    (120.0, '9B'),
+    }
+    fp_q = str(tmp_path / "query.mp3")
+    fps = [str(tmp_path / name) for name in cases]
+    with patch('pathlib.Path.stat') as mock_stat:
+        mock_stat.return_value.st_mtime = 1000.0
+        mock_stat.return_value.st_size  = 1000
+        _make_cache(tmp_path, fp_q, [1.0] * 20, [1.0] * 12, bpm=120.0, camelot='8A')
+        for fp, (bpm, camelot) in zip(fps, cases.values()):
+            _make_cache(tmp_path, fp, [1.0] * 20, [0.5] * 12, bpm=bpm, camelot=camelot)
+        every = find_similar(fp_q, [fp_q] + fps, tmp_path, top_n=25)
+        compat = find_similar(fp_q, [fp_q] + fps, tmp_path, top_n=25, compatible_only=True)
+    assert len(every) == len(cases)
+    assert sorted(r['name'] for r in compat) == ['adjacent', 'below', 'relative', 'same']
+    from analyzer.similarity import _camelot_compatible
+    assert _camelot_compatible('12A', '1A') and not _camelot_compatible('--', '8A')
+
+
+def test_cache_keys_from_directory_scan_match_stat(tmp_path):
+    """Keys built from one scandir pass equal per-file _cache_key; missing files drop out."""
+    from analyzer.similarity import _cache_key, _cache_keys
+    for sub in ("a", "b"):
+        (tmp_path / sub).mkdir()
+    fps = [str(tmp_path / "a" / "one.mp3"), str(tmp_path / "b" / "two.mp3"),
+           str(tmp_path / "a" / "three.mp3")]
+    for i, fp in enumerate(fps):
+        Path(fp).write_bytes(b"x" * (i + 1))
+    expected = [(fp, _cache_key(fp)) for fp in fps]
+    missing = str(tmp_path / "a" / "gone.mp3")
+    with patch('pathlib.Path.stat', side_effect=AssertionError("per-file stat")):
+        assert _cache_keys(fps) == expected
+    assert _cache_keys(fps[:1] + [missing]) == expected[:1]
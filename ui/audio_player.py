@@ -4,14 +4,29 @@ Audio Player — pygame-based playback with correct state machine.
 States: STOPPED → PLAYING → PAUSED → PLAYING (via resume)
         PLAYING/PAUSED → STOPPED (via stop)
         PLAYING → LOOP_PLAYING → PLAYING (via start_loop/stop_loop)
+
+position_changed fires on state transitions and seeks only; while playing,
+the UI polls get_position() at its own repaint cadence. A slow heartbeat
+detects end-of-track.
 """
 
 import pygame
 import time
+from collections import OrderedDict
 from enum import Enum, auto
+import numpy as np
+import soundfile as sf
+import soxr
 from PyQt6.QtCore import QObject, QTimer, pyqtSignal
 from pathlib import Path
 
+MIXER_SR = 44100   # pygame mixer output rate (see AudioPlayer.__init__)
+
+# Decoded loop segments, most recently used last:
+# (path, mtime, a_secs, b_secs, MIXER_SR) → C-contiguous int16 (n, 2) array
+_LOOP_CACHE: OrderedDict = OrderedDict()
+_LOOP_CACHE_SIZE = 8
+
 
 class PlayerState(Enum):
     STOPPED      = auto()
@@ -28,21 +43,25 @@ class AudioPlayer(QObject):
 
     def __init__(self):
         super().__init__()
-        pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=1024)
+        pygame.mixer.init(frequency=MIXER_SR, size=-16, channels=2, buffer=1024)
 
         self.current_file: str | None = None
         self.duration: float = 0.0
+        self._inv_duration: float = 0.0               # 1 / duration, 0 when unknown
         self.state = PlayerState.STOPPED
         self._play_start_time: float = 0.0
         self._paused_at_seconds: float = 0.0
         self._loop_sound: object | None = None        # pygame.mixer.Sound
         self._loop_sound_a_secs: float  = 0.0
         self._loop_sound_dur: float     = 0.0
+        self._loop_sound_dur_safe: float = 1e-9       # modulus for _current_seconds
         self._loop_sound_wall: float    = 0.0
 
+        # End-of-track heartbeat. pygame's set_endevent would need SDL's video
+        # subsystem for its event queue, which this Qt app never initialises.
         self._timer = QTimer()
-        self._timer.setInterval(50)
-        self._timer.timeout.connect(self._tick)
+        self._timer.setInterval(500)
+        self._timer.timeout.connect(self._check_finished)
 
     # ── Properties ───────────────────────────────────────────────────────
 
@@ -57,10 +76,10 @@ class AudioPlayer(QObject):
         try:
             self.stop()
             if not pygame.mixer.get_init():
-                pygame.mixer.init(frequency=44100, size=-16, channels=2, buffer=1024)
+                pygame.mixer.init(frequency=MIXER_SR, size=-16, channels=2, buffer=1024)
             pygame.mixer.music.load(str(file_path))
             self.current_file = str(file_path)
-            self.duration = 0.0
+            self.set_duration(0.0)
             self._paused_at_seconds = 0.0
             return True
         except Exception as e:
@@ -69,6 +88,7 @@ class AudioPlayer(QObject):
 
     def set_duration(self, duration: float) -> None:
         self.duration = duration
+        self._inv_duration = 1.0 / duration if duration > 0 else 0.0
 
     def play(self) -> None:
         """Start from beginning (or from seek position if recently seeked)."""
@@ -88,6 +108,7 @@ class AudioPlayer(QObject):
             self._play_start_time = time.time()
             self._paused_at_seconds = 0.0
             self._timer.start()
+            self.position_changed.emit(0.0)
         except Exception as e:
             print(f"AudioPlayer.play error: {e}")
 
@@ -106,6 +127,7 @@ class AudioPlayer(QObject):
                 pass
             self.state = PlayerState.PAUSED
             self._timer.stop()
+            self.position_changed.emit(self.get_position())
             return
         if self.state != PlayerState.PLAYING:
             return
@@ -122,6 +144,7 @@ class AudioPlayer(QObject):
             pygame.mixer.music.pause()
             self.state = PlayerState.PAUSED
             self._timer.stop()
+            self.position_changed.emit(self.get_position())
         except Exception as e:
             print(f"AudioPlayer.pause error: {e}")
 
@@ -134,6 +157,7 @@ class AudioPlayer(QObject):
             # Recalculate start time so position tracking is accurate
             self._play_start_time = time.time() - self._paused_at_seconds
             self._timer.start()
+            self.position_changed.emit(self.get_position())
         except Exception as e:
             print(f"AudioPlayer.resume error: {e}")
 
@@ -190,43 +214,8 @@ class AudioPlayer(QObject):
         with loops=-1 for gap-free looping.
         Returns True on success, False if Sound creation fails (caller falls back).
         """
-        import numpy as np
-        import soundfile as sf
-        import soxr
-
         try:
-            info = sf.info(str(file_path))
-            sr_native = info.samplerate
-            frame_a = int(a_secs * sr_native)
-            frame_b = min(int(b_secs * sr_native), info.frames)
-            n_frames = max(1, frame_b - frame_a)
-
-            data, _ = sf.read(
-                str(file_path),
-                start=frame_a,
-                frames=n_frames,
-                dtype='int16',
-                always_2d=True,
-            )
-
-            # pygame mixer is initialised at 44100 Hz; resample if source differs
-            mixer_sr = 44100
-            if sr_native != mixer_sr:
-                data_f = data.astype(np.float32) / 32768.0
-                left  = soxr.resample(data_f[:, 0], sr_native, mixer_sr, quality='HQ')
-                right = soxr.resample(
-                    data_f[:, 1] if data_f.shape[1] > 1 else data_f[:, 0],
-                    sr_native, mixer_sr, quality='HQ',
-                )
-                data_f = np.column_stack([left, right])
-                data = np.clip(data_f * 32768.0, -32768, 32767).astype(np.int16)
-
-            # Ensure stereo (mixer initialised with channels=2)
-            if data.shape[1] == 1:
-                data = np.column_stack([data[:, 0], data[:, 0]])
-
-            # Must be C-contiguous for pygame.sndarray
-            data = np.ascontiguousarray(data)
+            data = _loop_pcm(file_path, a_secs, b_secs)
 
             sound = pygame.sndarray.make_sound(data)
             sound.set_volume(pygame.mixer.music.get_volume())
@@ -238,13 +227,15 @@ class AudioPlayer(QObject):
 
             self._loop_sound        = sound
             self._loop_sound_a_secs = a_secs
-            self._loop_sound_dur    = (frame_b - frame_a) / mixer_sr
+            self._loop_sound_dur    = data.shape[0] / MIXER_SR
+            self._loop_sound_dur_safe = max(self._loop_sound_dur, 1e-9)
             self._loop_sound_wall   = time.time()
 
             sound.play(loops=-1)
 
             self.state = PlayerState.LOOP_PLAYING
             self._timer.start()
+            self.position_changed.emit(self.get_position())
             return True
 
         except Exception as e:
@@ -269,16 +260,15 @@ class AudioPlayer(QObject):
             self._paused_at_seconds = current_secs
             self.state = PlayerState.PLAYING
             self._timer.start()
+            self.position_changed.emit(self.get_position())
         except Exception as e:
             print(f"AudioPlayer.stop_loop resume error: {e}")
             self.state = PlayerState.PLAYING
 
     def get_position(self) -> float:
         """Current position as 0.0–1.0."""
-        if not self.current_file or self.duration <= 0:
-            return 0.0
-        secs = self._current_seconds()
-        return max(0.0, min(1.0, secs / self.duration))
+        # _inv_duration is 0 until a duration is known, which pins this at 0.0
+        return max(0.0, min(1.0, self._current_seconds() * self._inv_duration))
 
     # ── Internal ─────────────────────────────────────────────────────────
 
@@ -289,17 +279,59 @@ class AudioPlayer(QObject):
             return time.time() - self._play_start_time
         if self.state == PlayerState.LOOP_PLAYING:
             elapsed = time.time() - self._loop_sound_wall
-            return self._loop_sound_a_secs + (elapsed % max(self._loop_sound_dur, 1e-9))
+            return self._loop_sound_a_secs + (elapsed % self._loop_sound_dur_safe)
         return 0.0
 
-    def _tick(self) -> None:
-        if self.state == PlayerState.LOOP_PLAYING:
-            self.position_changed.emit(self.get_position())
-            return
+    def _check_finished(self) -> None:
         if self.state != PlayerState.PLAYING:
             return
         if not pygame.mixer.music.get_busy():
             self.stop()
             self.playback_finished.emit()
-            return
-        self.position_changed.emit(self.get_position())
+
+
+# ── Loop decoding ────────────────────────────────────────────────────────
+
+def _loop_pcm(file_path: str, a_secs: float, b_secs: float):
+    """Stereo int16 PCM of [a_secs, b_secs] at MIXER_SR, memoised in _LOOP_CACHE."""
+    key = (str(file_path), Path(file_path).stat().st_mtime, a_secs, b_secs, MIXER_SR)
+    data = _LOOP_CACHE.get(key)
+    if data is not None:
+        _LOOP_CACHE.move_to_end(key)
+        return data
+    data = _decode_loop(file_path, a_secs, b_secs)
+    _LOOP_CACHE[key] = data
+    if len(_LOOP_CACHE) > _LOOP_CACHE_SIZE:
+        _LOOP_CACHE.popitem(last=False)
+    return data
+
+
+def _decode_loop(file_path: str, a_secs: float, b_secs: float):
+    """Decode [a_secs, b_secs] of file_path to stereo int16 at MIXER_SR."""
+    # One open for header + frames, decoded straight into a preallocated buffer
+    with sf.SoundFile(str(file_path)) as f:
+        sr_native = f.samplerate
+        frame_a = min(int(a_secs * sr_native), f.frames)
+        frame_b = min(int(b_secs * sr_native), f.frames)
+        n_frames = max(1, frame_b - frame_a)
+        f.seek(frame_a)
+        data = np.empty((n_frames, f.channels), dtype=np.int16)
+        n_read = f.read(out=data, dtype='int16', always_2d=True).shape[0]
+    data = data[:n_read]
+
+    # pygame mixer is initialised at MIXER_SR; resample if source differs.
+    # soxr resamples int16 frames directly, all channels in one pass; MQ is
+    # plenty for a preview loop.
+    if data.shape[1] > 2:
+        data = data[:, :2]        # multichannel: front L/R only
+    if sr_native != MIXER_SR:
+        data = soxr.resample(data, sr_native, MIXER_SR, quality='MQ')
+
+    # Ensure stereo (mixer initialised with channels=2)
+    if data.shape[1] == 1:
+        data = np.broadcast_to(data, (data.shape[0], 2))   # view; copied once below
+
+    # Must be C-contiguous for pygame.sndarray; read-only since it is shared via the cache
+    data = np.ascontiguousarray(data)
+    data.flags.writeable = False
+    return data
@@ -9,21 +9,23 @@ Provides three sub-tabs:
 from __future__ import annotations
 
 import json
-import sys
+import os
+import re
+from array import array
+from functools import partial
 from pathlib import Path
 
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, QTimer, pyqtSignal
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton,
     QTableWidget, QTableWidgetItem, QHeaderView, QFileDialog, QTabWidget,
     QSplitter, QGroupBox, QInputDialog, QSizePolicy, QProgressBar, QMessageBox,
-    QApplication,
+    QApplication, QTableView, QStyledItemDelegate, QAbstractItemView,
 )
-from PyQt6.QtGui import QColor
+from PyQt6.QtGui import QBrush, QColor, QPainter
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
 from paths import get_data_dir
-from downloader.yt_handler import DownloadWorker, find_ffmpeg
+from downloader.yt_handler import DownloadWorker, FfmpegProbe
 from downloader.watcher import FolderWatcher
 from downloader.playlist_sync import (
     YouTubePlaylistSource,
@@ -35,6 +37,11 @@ from downloader.playlist_sync import (
     detect_apple_music_xml,
 )
 
+try:
+    import orjson   # optional — faster config (de)serialisation
+except ImportError:
+    orjson = None
+
 # ---------------------------------------------------------------------------
 # Constants
 # ---------------------------------------------------------------------------
@@ -45,12 +52,240 @@ _STATUS_PENDING     = "Pending"
 _STATUS_DOWNLOADING = "Downloading…"
 _STATUS_DONE        = "✓ Done"
 _STATUS_IMPORTING   = "⬆ Importing…"
+_STATUS_CANCELLED   = "✕ Cancelled"
+
+# SoulSeek table status text
+_SS_NEW      = "New"
+_SS_IMPORTED = "✓ Imported"
 
 _COLOR_DONE    = QColor(0, 200, 80)
 _COLOR_ERROR   = QColor(255, 60, 60)
 _COLOR_PENDING = QColor(80, 95, 130)
 _COLOR_ACTIVE  = QColor(0, 160, 255)
 
+# Shared brushes: a QColor passed as a foreground is converted to a new QBrush each time
+_BRUSH_DONE    = QBrush(_COLOR_DONE)
+_BRUSH_ERROR   = QBrush(_COLOR_ERROR)
+_BRUSH_PENDING = QBrush(_COLOR_PENDING)
+_BRUSH_ACTIVE  = QBrush(_COLOR_ACTIVE)
+
+# yt-dlp errors that mean the video needs age verification (cookies)
+_AGE_RE = re.compile(r"sign in to confirm your age|age[- ]restrict", re.IGNORECASE)
+
+# Sub-tab indices
+_TAB_QUEUE    = 0
+_TAB_SUBS     = 1
+_TAB_SOULSEEK = 2
+
+
+# ---------------------------------------------------------------------------
+# Config file
+# ---------------------------------------------------------------------------
+
+def _dump_config(config: dict) -> bytes:
+    """Serialise the config as indented JSON bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(config, option=orjson.OPT_INDENT_2)
+    return json.dumps(config, indent=2).encode()
+
+
+def _parse_config(data: bytes) -> dict:
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+# ---------------------------------------------------------------------------
+# Queue model
+# ---------------------------------------------------------------------------
+
+class QueueModel(QAbstractTableModel):
+    """
+    Table model over the download queue (a list of dicts shared with
+    DownloadsTab). Rows are derived from each item's fields on demand, so
+    the view only materialises what is on screen.
+    """
+
+    HEADERS = ["Title", "Source", "Status", "Action"]
+
+    def __init__(self, items: list[dict], parent=None):
+        super().__init__(parent)
+        self.items = items
+        self._row_of: dict[int, int] = {}   # id(item) → row
+        # Items queued by anything other than a manual add, kept current on insert/remove
+        self.non_manual_count = 0
+
+    # ── Qt model interface ─────────────────────────────────────────────
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.items)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if (orientation == Qt.Orientation.Horizontal
+                and role == Qt.ItemDataRole.DisplayRole):
+            return self.HEADERS[section]
+        return None
+
+    def flags(self, index):
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        item = self.items[index.row()]
+        col  = index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            if col == 0:
+                return item["title"]
+            if col == 1:
+                return item["source_label"]
+            if col == 2:
+                return self.status_text(item)
+            return self.action_text(item)
+        if role == Qt.ItemDataRole.ForegroundRole and col == 2:
+            return self.status_brush(item)
+        if role == Qt.ItemDataRole.ToolTipRole:
+            if col == 0:
+                return item["url"]
+            if col == 2:
+                return item.get("tooltip")
+            if col == 3 and self.action_text(item):
+                return ("Import into library" if item["status"] == _STATUS_DONE
+                        else "Remove from queue")
+        if role == Qt.ItemDataRole.TextAlignmentRole and col == 3:
+            return Qt.AlignmentFlag.AlignCenter
+        return None
+
+    # ── Derived display values ─────────────────────────────────────────
+
+    @staticmethod
+    def status_text(item: dict) -> str:
+        if item["status"] == _STATUS_DOWNLOADING:
+            return f"⬇  {item.get('progress', 0)}%"
+        return item["status"]
+
+    @staticmethod
+    def status_brush(item: dict) -> QBrush:
+        status = item["status"]
+        if status == _STATUS_PENDING:
+            return _BRUSH_PENDING
+        if status == _STATUS_DOWNLOADING:
+            return _BRUSH_ACTIVE
+        if status == _STATUS_DONE:
+            return _BRUSH_DONE
+        return _BRUSH_ERROR
+
+    @staticmethod
+    def action_text(item: dict) -> str:
+        if item["status"] == _STATUS_DONE:
+            return "⬆ Import"
+        if item["status"] in (_STATUS_PENDING, _STATUS_CANCELLED):
+            return "✕"
+        return ""
+
+    # ── Mutation helpers ───────────────────────────────────────────────
+
+    def item(self, row: int) -> dict:
+        return self.items[row]
+
+    def row_of(self, item: dict) -> int:
+        """Row currently holding ``item``, or -1 if it has been removed."""
+        return self._row_of.get(id(item), -1)
+
+    def append(self, new_items: list[dict]) -> None:
+        if not new_items:
+            return
+        first = len(self.items)
+        self.beginInsertRows(QModelIndex(), first, first + len(new_items) - 1)
+        for row, item in enumerate(new_items, start=first):
+            self.items.append(item)
+            self._row_of[id(item)] = row
+            self.non_manual_count += item["source_label"] != "Manual"
+        self.endInsertRows()
+
+    def remove_rows(self, rows) -> None:
+        """Remove the given rows (any order), one contiguous run at a time."""
+        rows = sorted(set(rows), reverse=True)
+        if not rows:
+            return
+        i = 0
+        while i < len(rows):
+            last = first = rows[i]
+            i += 1
+            while i < len(rows) and rows[i] == first - 1:
+                first = rows[i]
+                i += 1
+            self.beginRemoveRows(QModelIndex(), first, last)
+            self.non_manual_count -= sum(
+                item["source_label"] != "Manual" for item in self.items[first:last + 1])
+            del self.items[first:last + 1]
+            self.endRemoveRows()
+        self._reindex()
+
+    def remove_where(self, pred) -> None:
+        """Drop every item matching ``pred`` in one in-place compaction pass."""
+        kept = []
+        removed_non_manual = 0
+        for item in self.items:
+            if not pred(item):
+                kept.append(item)
+            elif item["source_label"] != "Manual":
+                removed_non_manual += 1
+        if len(kept) == len(self.items):
+            return
+        self.non_manual_count -= removed_non_manual
+        self.beginResetModel()
+        self.items[:] = kept   # in place: the list is shared with DownloadsTab
+        self._reindex()
+        self.endResetModel()
+
+    def item_changed(self, item: dict) -> None:
+        """Repaint ``item``'s row after its fields were mutated in place."""
+        row = self.row_of(item)
+        if row >= 0:
+            self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.HEADERS) - 1))
+
+    def all_changed(self) -> None:
+        if self.items:
+            self.dataChanged.emit(
+                self.index(0, 0),
+                self.index(len(self.items) - 1, len(self.HEADERS) - 1))
+
+    def _reindex(self) -> None:
+        self._row_of = {id(item): row for row, item in enumerate(self.items)}
+
+
+class _QueueActionDelegate(QStyledItemDelegate):
+    """Paints the Action column as a button (Import) or a bare ✕, with no cell widgets."""
+
+    _IMPORT_BG     = QColor("#003d1a")
+    _IMPORT_BORDER = QColor("#006622")
+    _IMPORT_TEXT   = QColor("#00cc66")
+    _REMOVE_TEXT   = QColor("#556677")
+
+    def paint(self, painter, option, index):
+        text = index.data(Qt.ItemDataRole.DisplayRole)
+        if not text:
+            super().paint(painter, option, index)
+            return
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        if text == "✕":
+            painter.setPen(self._REMOVE_TEXT)
+            painter.drawText(option.rect, Qt.AlignmentFlag.AlignCenter, text)
+        else:
+            rect = option.rect.adjusted(1, 3, -1, -3)
+            painter.setPen(self._IMPORT_BORDER)
+            painter.setBrush(self._IMPORT_BG)
+            painter.drawRoundedRect(rect, 3, 3)
+            font = painter.font()
+            font.setBold(True)
+            painter.setFont(font)
+            painter.setPen(self._IMPORT_TEXT)
+            painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, text)
+        painter.restore()
+
 
 # ---------------------------------------------------------------------------
 # DownloadsTab
@@ -76,19 +311,30 @@ class DownloadsTab(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
 
-        # Detect ffmpeg once at startup — enables MP3 320 kbps output
-        self._ffmpeg_path: str | None = find_ffmpeg()
-
-        # Queue state: list of dicts
-        # {url, title, source_label, status, file_path, worker_key}
+        # Queue state: list of dicts, shared with QueueModel
+        # {url, title, source_label, status, file_path, progress?, tooltip?}
         self._queue: list[dict] = []
         self._worker: DownloadWorker | None = None
         self._active_url: str | None = None
+        self._active: dict | None = None      # queue item of the running download
 
         # SoulSeek watcher state
         self._watcher = FolderWatcher()
         self._watcher.file_detected.connect(self._on_file_detected)
-        self._watcher_items: list[dict] = []  # {file_path, size_mb, imported}
+        # Watcher items as parallel arrays, one entry per SoulSeek table row
+        self._wi_paths: list[str] = []
+        self._wi_sizes = array("f")          # size in MB
+        self._wi_imported = bytearray()      # 1 once imported
+        self._n_new_unimported = 0   # watcher items not yet imported
+        # A finished download fires several fs events for the same path;
+        # collect them and add rows 250 ms after the first one. The timer is
+        # not restarted per event, so a download that keeps writing cannot
+        # hold rows back indefinitely.
+        self._ss_pending: dict[str, int] = {}   # path → size in bytes (latest event wins)
+        self._ss_timer = QTimer(self)
+        self._ss_timer.setSingleShot(True)
+        self._ss_timer.setInterval(250)
+        self._ss_timer.timeout.connect(self._flush_detected_files)
 
         # Subscription sync worker
         self._sync_worker: PlaylistSyncWorker | None = None
@@ -96,15 +342,54 @@ class DownloadsTab(QWidget):
         # Not-found items from subscription sync
         self._not_found: list[dict] = []
 
+        # Sync sources built from the current subscriptions (see _build_sources)
+        self._sources: list = []
+        self._sources_key: tuple | None = None
+
+        # Sync results arrive one signal per track; rows are added in batches
+        self._pending_tracks: list[dict] = []
+        self._pending_not_found: list[dict] = []
+        self._sync_flush_timer = QTimer(self)
+        self._sync_flush_timer.setSingleShot(True)
+        self._sync_flush_timer.setInterval(50)
+        self._sync_flush_timer.timeout.connect(self._flush_sync_results)
+
+        # Download progress ticks are applied at most once per frame
+        self._progress_pending: dict[str, int] = {}   # url → percent
+        self._progress_flush = QTimer(self)
+        self._progress_flush.setSingleShot(True)
+        self._progress_flush.setInterval(16)
+        self._progress_flush.timeout.connect(self._flush_progress)
+
         self._config: dict = {}
+        self._config_bytes: bytes | None = None   # last serialised config on disk
+        self._config_unsynced = False             # written since the last fsync
         self._load_config()
 
+        # ffmpeg enables MP3 320 kbps output. Start with the path found last
+        # session (if it still exists) and re-detect in the background.
+        cached = self._config.get("ffmpeg_path") or None
+        self._ffmpeg_path: str | None = cached if cached and os.path.isfile(cached) else None
+        self._ffmpeg_probe = FfmpegProbe(self)
+        self._ffmpeg_probe.found.connect(self._on_ffmpeg_found)
+
+        # Coalesce config writes: typing a path saves once, 300 ms after the last key
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(300)
+        self._save_timer.timeout.connect(self._flush_config)
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._on_about_to_quit)
+
         self._build_ui()
+        self._ffmpeg_probe.start()
 
-        # Restore watcher if a watch dir was saved
+        # Restore watcher if a watch dir was saved (runs headless until the
+        # SoulSeek tab is first opened)
         watch_dir = self._config.get("watch_dir", "")
         if watch_dir and Path(watch_dir).exists():
-            self._start_watcher()
+            self._start_watcher(watch_dir)
 
     # ------------------------------------------------------------------
     # UI Construction
@@ -115,13 +400,36 @@ class DownloadsTab(QWidget):
         outer.setContentsMargins(0, 0, 0, 0)
         outer.setSpacing(0)
 
+        # Only the Queue tab is built up front; the others are placeholders
+        # until first shown (see _ensure_tab)
         self._sub_tabs = QTabWidget()
-        self._sub_tabs.addTab(self._build_queue_tab(),     "⬇  Queue")
-        self._sub_tabs.addTab(self._build_subs_tab(),      "📋  Subscriptions")
-        self._sub_tabs.addTab(self._build_soulseek_tab(),  "🎵  SoulSeek Watcher")
+        self._sub_tabs.addTab(self._build_queue_tab(), "⬇  Queue")
+        self._sub_tabs.addTab(QWidget(),               "📋  Subscriptions")
+        self._sub_tabs.addTab(QWidget(),               "🎵  SoulSeek Watcher")
+        self._tab_builders = {
+            _TAB_SUBS:     self._build_subs_tab,
+            _TAB_SOULSEEK: self._build_soulseek_tab,
+        }
+        self._sub_tabs.currentChanged.connect(self._ensure_tab)
 
         outer.addWidget(self._sub_tabs)
 
+    def _ensure_tab(self, index: int) -> None:
+        """Build sub-tab ``index`` in place of its placeholder if not built yet."""
+        builder = self._tab_builders.pop(index, None)
+        if builder is None:
+            return
+        label   = self._sub_tabs.tabText(index)
+        current = self._sub_tabs.currentIndex()
+        page    = builder()
+        self._sub_tabs.blockSignals(True)
+        placeholder = self._sub_tabs.widget(index)
+        self._sub_tabs.removeTab(index)
+        self._sub_tabs.insertTab(index, page, label)
+        self._sub_tabs.setCurrentIndex(current)
+        self._sub_tabs.blockSignals(False)
+        placeholder.deleteLater()
+
     # ── Queue tab ──────────────────────────────────────────────────────
 
     def _build_queue_tab(self) -> QWidget:
@@ -172,9 +480,7 @@ class DownloadsTab(QWidget):
         self._output_dir_edit = QLineEdit()
         self._output_dir_edit.setPlaceholderText("Choose output folder…")
         self._output_dir_edit.setText(self._config.get("yt_output_dir", ""))
-        self._output_dir_edit.textChanged.connect(
-            lambda t: self._config.__setitem__("yt_output_dir", t) or self._save_config()
-        )
+        self._output_dir_edit.textChanged.connect(self._on_output_dir_edited)
         folder_row.addWidget(self._output_dir_edit, stretch=1)
         btn_browse = QPushButton("Browse")
         btn_browse.setFixedWidth(72)
@@ -183,19 +489,16 @@ class DownloadsTab(QWidget):
         lay.addLayout(folder_row)
 
         # Format indicator
-        if self._ffmpeg_path:
-            fmt_text = "🎵  Format: MP3 320 kbps  (ffmpeg detected)"
-            fmt_color = "#00cc66"
-        else:
-            fmt_text = "🎵  Format: m4a (best quality)  — install ffmpeg for MP3 320 kbps"
-            fmt_color = "#ffaa00"
-        fmt_lbl = QLabel(fmt_text)
-        fmt_lbl.setStyleSheet(f"color: {fmt_color}; font-size: 11px; padding: 2px 0;")
-        lay.addWidget(fmt_lbl)
+        self._fmt_lbl = QLabel()
+        self._update_format_label()
+        lay.addWidget(self._fmt_lbl)
 
         # Queue table
-        self._queue_table = QTableWidget(0, 4)
-        self._queue_table.setHorizontalHeaderLabels(["Title", "Source", "Status", "Action"])
+        self._queue_model = QueueModel(self._queue, self)
+        self._queue_table = QTableView()
+        self._queue_table.setModel(self._queue_model)
+        self._queue_table.setItemDelegateForColumn(3, _QueueActionDelegate(self._queue_table))
+        self._queue_table.clicked.connect(self._on_queue_clicked)
         hdr = self._queue_table.horizontalHeader()
         hdr.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
         hdr.setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
@@ -203,8 +506,8 @@ class DownloadsTab(QWidget):
         hdr.setSectionResizeMode(3, QHeaderView.ResizeMode.Fixed)
         self._queue_table.setColumnWidth(3, 90)
         self._queue_table.verticalHeader().setDefaultSectionSize(28)
-        self._queue_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self._queue_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self._queue_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self._queue_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         lay.addWidget(self._queue_table, stretch=1)
 
         # Bottom action row
@@ -305,9 +608,7 @@ class DownloadsTab(QWidget):
         # Hidden XML field — still used internally by _build_sources for XML-based playlists
         self._xml_edit = QLineEdit()
         self._xml_edit.setText(self._config.get("apple_music_xml", ""))
-        self._xml_edit.textChanged.connect(
-            lambda t: self._config.__setitem__("apple_music_xml", t) or self._save_config()
-        )
+        self._xml_edit.textChanged.connect(self._on_xml_path_edited)
         self._xml_edit.setVisible(False)  # hidden — managed via secondary button below
 
         self._am_table = _make_sub_table(2, ["Playlist", ""])
@@ -480,6 +781,16 @@ class DownloadsTab(QWidget):
         bottom_row.addStretch()
         lay.addLayout(bottom_row)
 
+        # Catch up with a watcher that was started before this tab existed
+        self._add_ss_rows(0)
+        if self._watcher.is_watching:
+            self.btn_watch_toggle.setText("⏹  Stop Watching")
+            if self._wi_paths:
+                self._update_watch_status()
+            else:
+                self._watch_status_lbl.setText(
+                    f"● Watching: {self._config.get('watch_dir', '')}")
+
         return page
 
     # ------------------------------------------------------------------
@@ -537,12 +848,10 @@ class DownloadsTab(QWidget):
                 "yt-dlp will attempt to download it directly.")
             return
 
-        for t in tracks:
-            track_url = t.get("url") or ""
-            title = t.get("title") or track_url
-            if not track_url:
-                continue
-            self._add_to_queue(track_url, title=title, source_label="Manual")
+        self._add_many_to_queue([
+            (t["url"], t.get("title") or t["url"], "Manual")
+            for t in tracks if t.get("url")
+        ])
 
     def _sync_status_lbl_safe_set(self, text: str) -> None:
         """Set sync status label if it exists (it's on the Subscriptions tab)."""
@@ -551,30 +860,37 @@ class DownloadsTab(QWidget):
             lbl.setText(text)
 
     def _add_to_queue(self, url: str, title: str = "", source_label: str = "Manual") -> None:
-        """Add a URL to the queue list and insert a row in the table."""
-        item = {
-            "url":          url,
-            "title":        title or url,
-            "source_label": source_label,
-            "status":       _STATUS_PENDING,
-            "file_path":    None,
-        }
-        self._queue.append(item)
-        row = self._queue_table.rowCount()
-        self._queue_table.insertRow(row)
-
-        q_idx = len(self._queue) - 1
-        title_item = QTableWidgetItem(item["title"])
-        title_item.setToolTip(url)
-        title_item.setData(Qt.ItemDataRole.UserRole, q_idx)
-        self._queue_table.setItem(row, 0, title_item)
-        self._queue_table.setItem(row, 1, QTableWidgetItem(source_label))
-        status_item = QTableWidgetItem(_STATUS_PENDING)
-        status_item.setForeground(_COLOR_PENDING)
-        self._queue_table.setItem(row, 2, status_item)
-        # ✕ remove button for pending rows
-        btn_rm = self._make_queue_item_remove_btn(q_idx)
-        self._queue_table.setCellWidget(row, 3, btn_rm)
+        """Queue a single URL (manual adds); batches go through _add_many_to_queue."""
+        self._add_many_to_queue([(url, title, source_label)])
+
+    def _add_many_to_queue(self, entries: list[tuple[str, str, str]]) -> None:
+        """Queue (url, title, source_label) entries as one model insertion."""
+        self._queue_model.append([
+            {
+                "url":          url,
+                "title":        title or url,
+                "source_label": source_label,
+                "status":       _STATUS_PENDING,
+                "file_path":    None,
+            }
+            for url, title, source_label in entries
+        ])
+
+    def _update_format_label(self) -> None:
+        if self._ffmpeg_path:
+            fmt_text = "🎵  Format: MP3 320 kbps  (ffmpeg detected)"
+            fmt_color = "#00cc66"
+        else:
+            fmt_text = "🎵  Format: m4a (best quality)  — install ffmpeg for MP3 320 kbps"
+            fmt_color = "#ffaa00"
+        self._fmt_lbl.setText(fmt_text)
+        self._fmt_lbl.setStyleSheet(f"color: {fmt_color}; font-size: 11px; padding: 2px 0;")
+
+    def _on_ffmpeg_found(self, path: str | None) -> None:
+        """Background ffmpeg detection finished; applies to downloads started from now on."""
+        self._ffmpeg_path = path
+        self._set_config("ffmpeg_path", path or "")
+        self._update_format_label()
 
     def _on_download_all(self) -> None:
         self._start_next_download()
@@ -592,25 +908,17 @@ class DownloadsTab(QWidget):
         output_path.mkdir(parents=True, exist_ok=True)
 
         # Find first pending queue item
-        for i, item in enumerate(self._queue):
+        for item in self._queue:
             if item["status"] == _STATUS_PENDING:
-                self._start_download_item(i, output_path)
+                self._start_download_item(item, output_path)
                 return
 
-    def _start_download_item(self, queue_idx: int, output_dir: Path) -> None:
-        item = self._queue[queue_idx]
+    def _start_download_item(self, item: dict, output_dir: Path) -> None:
         item["status"] = _STATUS_DOWNLOADING
+        item["progress"] = 0
         self._active_url = item["url"]
-
-        # Update table row
-        row = self._row_for_queue_idx(queue_idx)
-        if row >= 0:
-            status_item = QTableWidgetItem("⬇  0%")
-            status_item.setForeground(_COLOR_ACTIVE)
-            self._queue_table.setItem(row, 2, status_item)
-            # Replace ✕ with a cancel hint while downloading
-            self._queue_table.removeCellWidget(row, 3)
-            self._queue_table.setItem(row, 3, QTableWidgetItem(""))
+        self._active = item
+        self._queue_model.item_changed(item)
 
         self.btn_stop.setEnabled(True)
 
@@ -627,63 +935,51 @@ class DownloadsTab(QWidget):
         worker.start()
 
     def _on_dl_progress(self, url: str, fraction: float) -> None:
-        row = self._row_for_active_url(url)
-        if row >= 0:
-            pct = int(fraction * 100)
-            status_item = QTableWidgetItem(f"⬇  {pct}%")
-            status_item.setForeground(_COLOR_ACTIVE)
-            self._queue_table.setItem(row, 2, status_item)
+        self._progress_pending[url] = int(fraction * 100)
+        if not self._progress_flush.isActive():
+            self._progress_flush.start()
+
+    def _flush_progress(self) -> None:
+        """Apply buffered progress and repaint the changed Status cells in one signal."""
+        pending, self._progress_pending = self._progress_pending, {}
+        rows = []
+        for url, pct in pending.items():
+            item = self._active_item(url)
+            if item is None or item.get("progress") == pct:
+                continue
+            item["progress"] = pct
+            rows.append(self._queue_model.row_of(item))
+        if rows:
+            model = self._queue_model
+            model.dataChanged.emit(
+                model.index(min(rows), 2), model.index(max(rows), 2),
+                [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ForegroundRole])
 
     def _on_dl_title_found(self, url: str, title: str) -> None:
-        row = self._row_for_active_url(url)
-        if row >= 0:
-            self._queue_table.item(row, 0).setText(title)
-            # Update queue item title
-            for item in self._queue:
-                if item["url"] == url and item["status"] == _STATUS_DOWNLOADING:
-                    item["title"] = title
-                    break
+        item = self._active_item(url)
+        if item is not None:
+            item["title"] = title
+            self._queue_model.item_changed(item)
 
     def _on_dl_done(self, url: str, file_path: str) -> None:
-        row = self._row_for_active_url(url)
-        for item in self._queue:
-            if item["url"] == url and item["status"] == _STATUS_DOWNLOADING:
-                item["status"] = _STATUS_DONE
-                item["file_path"] = file_path
-                break
-
-        if row >= 0:
-            status_item = QTableWidgetItem(_STATUS_DONE)
-            status_item.setForeground(_COLOR_DONE)
-            self._queue_table.setItem(row, 2, status_item)
-
-            btn = QPushButton("⬆ Import")
-            btn.setFixedSize(88, 22)
-            btn.setStyleSheet(
-                "QPushButton { background: #003d1a; color: #00cc66; border: 1px solid #006622;"
-                " border-radius: 3px; font-size: 11px; font-weight: 600; }"
-                "QPushButton:hover { background: #005522; border-color: #00aa44; }"
-            )
-            fp = file_path
-            btn.clicked.connect(lambda _c=False, p=fp: self.import_requested.emit(p))
-            self._queue_table.setCellWidget(row, 3, btn)
-
+        item = self._active_item(url)
         title = ""
-        for item in self._queue:
-            if item.get("file_path") == file_path:
-                title = item.get("title", "")
-                break
+        if item is not None:
+            item["status"] = _STATUS_DONE
+            item["file_path"] = file_path
+            title = item.get("title", "")
+            self._queue_model.item_changed(item)
         self.notify.emit("Download complete", title or Path(file_path).stem)
 
         self._worker = None
         self._active_url = None
+        self._active = None
         self.btn_stop.setEnabled(False)
         self._start_next_download()
 
     def _on_dl_error(self, url: str, message: str) -> None:
-        row = self._row_for_active_url(url)
         # Make age-restriction errors actionable
-        if "Sign in to confirm your age" in message or "age" in message.lower():
+        if _AGE_RE.search(message):
             display = "⚠ Age-restricted"
             tooltip = (
                 "This video requires age verification.\n"
@@ -697,45 +993,29 @@ class DownloadsTab(QWidget):
             display = "⚠ Error"
             tooltip = message
 
-        for item in self._queue:
-            if item["url"] == url and item["status"] == _STATUS_DOWNLOADING:
-                item["status"] = display
-                break
-        if row >= 0:
-            status_item = QTableWidgetItem(display)
-            status_item.setForeground(_COLOR_ERROR)
-            status_item.setToolTip(tooltip)
-            self._queue_table.setItem(row, 2, status_item)
+        item = self._active_item(url)
+        if item is not None:
+            item["status"] = display
+            item["tooltip"] = tooltip
+            self._queue_model.item_changed(item)
 
         self._worker = None
         self._active_url = None
+        self._active = None
         self.btn_stop.setEnabled(False)
         self._start_next_download()
 
     def _on_import_selected(self) -> None:
-        selected_rows = {idx.row() for idx in self._queue_table.selectedIndexes()}
+        selected_rows = {idx.row() for idx in self._queue_table.selectionModel().selectedRows()}
         # If nothing selected, import every done row as a convenience
         import_all = not selected_rows
-        for row in range(self._queue_table.rowCount()):
-            status_item = self._queue_table.item(row, 2)
-            if status_item and status_item.text() == _STATUS_DONE:
+        for row, item in enumerate(self._queue):
+            if item["status"] == _STATUS_DONE and item.get("file_path"):
                 if import_all or row in selected_rows:
-                    q_idx = self._queue_idx_for_row(row)
-                    if q_idx >= 0 and self._queue[q_idx].get("file_path"):
-                        self.import_requested.emit(self._queue[q_idx]["file_path"])
+                    self.import_requested.emit(item["file_path"])
 
     def _on_clear_done(self) -> None:
-        rows_to_remove = [
-            r for r in range(self._queue_table.rowCount() - 1, -1, -1)
-            if self._queue_table.item(r, 2)
-               and self._queue_table.item(r, 2).text() == _STATUS_DONE
-        ]
-        for r in rows_to_remove:
-            self._queue_table.removeRow(r)
-        self._queue = [
-            item for item in self._queue
-            if item["status"] != _STATUS_DONE
-        ]
+        self._queue_model.remove_where(lambda item: item["status"] == _STATUS_DONE)
 
     def _on_stop_download(self) -> None:
         """Stop current download and cancel ALL pending items in the queue."""
@@ -744,80 +1024,40 @@ class DownloadsTab(QWidget):
             self._worker.terminate()
             self._worker.wait(3000)
 
-        # 2) Mark active item as Cancelled in the table
-        if self._active_url:
-            for item in self._queue:
-                if item["url"] == self._active_url and item["status"] == _STATUS_DOWNLOADING:
-                    item["status"] = "✕ Cancelled"
-                    row = self._row_for_active_url(self._active_url)
-                    if row >= 0:
-                        si = QTableWidgetItem("✕ Cancelled")
-                        si.setForeground(_COLOR_ERROR)
-                        self._queue_table.setItem(row, 2, si)
-                        q_idx = self._queue_idx_for_row(row)
-                        if q_idx >= 0:
-                            self._queue_table.setCellWidget(
-                                row, 3, self._make_queue_item_remove_btn(q_idx))
-                    break
-
-        # 3) Cancel ALL pending items so the queue won't auto-resume
-        for row in range(self._queue_table.rowCount()):
-            status_item = self._queue_table.item(row, 2)
-            if status_item and status_item.text() == _STATUS_PENDING:
-                si = QTableWidgetItem("✕ Cancelled")
-                si.setForeground(_COLOR_ERROR)
-                self._queue_table.setItem(row, 2, si)
-                q_idx = self._queue_idx_for_row(row)
-                if q_idx >= 0 and q_idx < len(self._queue):
-                    self._queue[q_idx]["status"] = "✕ Cancelled"
-                    self._queue_table.setCellWidget(
-                        row, 3, self._make_queue_item_remove_btn(q_idx))
+        # 2) Mark the active item and 3) ALL pending items as Cancelled,
+        #    so the queue won't auto-resume
+        item = self._active_item(self._active_url)
+        if item is not None:
+            item["status"] = _STATUS_CANCELLED
+        for item in self._queue:
+            if item["status"] == _STATUS_PENDING:
+                item["status"] = _STATUS_CANCELLED
+        self._queue_model.all_changed()
 
         self._worker = None
         self._active_url = None
+        self._active = None
         self.btn_stop.setEnabled(False)
         # Don't call _start_next_download — user explicitly stopped everything
 
     def _on_remove_selected(self) -> None:
         """Remove selected rows from the queue (non-active only)."""
-        selected_rows = sorted(
-            {idx.row() for idx in self._queue_table.selectedIndexes()},
-            reverse=True,
+        selected_rows = {idx.row() for idx in self._queue_table.selectionModel().selectedRows()}
+        # Skip the active download — use Stop first
+        self._queue_model.remove_rows(
+            row for row in selected_rows
+            if self._queue[row]["status"] != _STATUS_DOWNLOADING
         )
-        if not selected_rows:
-            return
-        for row in selected_rows:
-            q_idx = self._queue_idx_for_row(row)
-            if q_idx >= 0:
-                item = self._queue[q_idx]
-                if item["status"] == _STATUS_DOWNLOADING:
-                    continue  # skip active download — use Stop first
-                item["status"] = "__removed__"
-            self._queue_table.removeRow(row)
-
-    def _make_queue_item_remove_btn(self, q_idx: int) -> QPushButton:
-        """Tiny transparent ✕ button for pending/cancelled queue rows."""
-        btn = QPushButton("✕")
-        btn.setFixedSize(30, 22)
-        btn.setToolTip("Remove from queue")
-        btn.setStyleSheet(
-            "QPushButton { color: #556677; border: none; background: transparent; font-size: 13px; }"
-            "QPushButton:hover { color: #ff6666; }"
-        )
-        btn.clicked.connect(lambda _checked=False, idx=q_idx: self._remove_queue_item_by_idx(idx))
-        return btn
 
-    def _remove_queue_item_by_idx(self, q_idx: int) -> None:
-        """Remove a queue item by its stored index (only if not currently downloading)."""
-        if q_idx >= len(self._queue):
+    def _on_queue_clicked(self, index: QModelIndex) -> None:
+        """Action column: Import a finished download, or ✕ remove a pending/cancelled one."""
+        if index.column() != 3:
             return
-        item = self._queue[q_idx]
-        if item["status"] == _STATUS_DOWNLOADING:
-            return  # can't remove active — use Stop first
-        item["status"] = "__removed__"
-        row = self._row_for_queue_idx(q_idx)
-        if row >= 0:
-            self._queue_table.removeRow(row)
+        item = self._queue_model.item(index.row())
+        if item["status"] == _STATUS_DONE and item.get("file_path"):
+            self.import_requested.emit(item["file_path"])
+        elif item["status"] in (_STATUS_PENDING, _STATUS_CANCELLED):
+            self._queue_model.remove_rows([index.row()])
 
     # ------------------------------------------------------------------
     # Subscriptions tab — actions
@@ -834,9 +1074,10 @@ class DownloadsTab(QWidget):
             return
         label = label.strip() or url.strip()
         subs = self._config.setdefault("subscriptions", [])
-        subs.append({"type": "youtube", "url": url.strip(), "label": label})
+        sub = {"type": "youtube", "url": url.strip(), "label": label}
+        subs.append(sub)
         self._save_config()
-        self._refresh_subscription_tables()
+        self._add_subscription_row(sub)
 
     def _on_add_am_playlist(self) -> None:
         """Add an Apple Music playlist by name via local iTunes XML (secondary/advanced)."""
@@ -865,9 +1106,10 @@ class DownloadsTab(QWidget):
         if not ok or not name.strip():
             return
         subs = self._config.setdefault("subscriptions", [])
-        subs.append({"type": "apple_music", "playlist": name.strip()})
+        sub = {"type": "apple_music", "playlist": name.strip()}
+        subs.append(sub)
         self._save_config()
-        self._refresh_subscription_tables()
+        self._add_subscription_row(sub)
 
     def _on_quick_add_am_url(self) -> None:
         """Quick-add an Apple Music URL from the URL field (no dialog needed)."""
@@ -893,10 +1135,11 @@ class DownloadsTab(QWidget):
         if any(s.get("url") == url for s in subs):
             QMessageBox.information(self, "Already Added", "This playlist is already subscribed.")
             return
-        subs.append({"type": "apple_music_url", "url": url, "label": label})
+        sub = {"type": "apple_music_url", "url": url, "label": label}
+        subs.append(sub)
         self._save_config()
         self._am_url_edit.clear()
-        self._refresh_subscription_tables()
+        self._add_subscription_row(sub)
 
     def _on_add_am_url(self) -> None:
         """Legacy dialog-based Apple Music URL add (kept for internal compatibility)."""
@@ -926,10 +1169,11 @@ class DownloadsTab(QWidget):
         if any(s.get("url") == url for s in subs):
             QMessageBox.information(self, "Already Added", "This playlist is already subscribed.")
             return
-        subs.append({"type": "spotify", "url": url, "label": label})
+        sub = {"type": "spotify", "url": url, "label": label}
+        subs.append(sub)
         self._save_config()
         self._sp_url_edit.clear()
-        self._refresh_subscription_tables()
+        self._add_subscription_row(sub)
 
     def _on_clear_sync_cache(self) -> None:
         """Reset sync state so all playlist tracks re-queue on next sync."""
@@ -949,7 +1193,7 @@ class DownloadsTab(QWidget):
         self._sync_status_lbl.setText("Syncing…")
         self.btn_sync.setEnabled(False)
         worker = PlaylistSyncWorker(sources, load_sync_state())
-        worker.new_track.connect(self._on_sync_new_track)
+        worker.new_tracks_batch.connect(self._on_sync_new_tracks)
         worker.track_not_found.connect(self._on_sync_not_found)
         worker.source_error.connect(self._on_sync_source_error)
         worker.all_done.connect(self._on_sync_all_done)
@@ -957,28 +1201,52 @@ class DownloadsTab(QWidget):
         worker.start()
 
     def _on_sync_new_track(self, track: dict) -> None:
-        url = track.get("url", "")
-        if not url:
+        if not track.get("url"):
             return
-        title  = track.get("title", url)
-        artist = track.get("artist", "")
-        if artist:
-            title = f"{artist} — {title}"
-        label = track.get("source_label", "Subscription")
-        self._add_to_queue(url, title=title, source_label=label)
+        self._pending_tracks.append(track)
+        self._sync_flush_timer.start()
+
+    def _on_sync_new_tracks(self, tracks: list) -> None:
+        """A batch from PlaylistSyncWorker: already coalesced, insert right away."""
+        self._pending_tracks.extend(t for t in tracks if t.get("url"))
+        self._flush_sync_results()
 
     def _on_sync_not_found(self, track: dict) -> None:
-        self._not_found.append(track)
-        row = self._nf_table.rowCount()
-        self._nf_table.insertRow(row)
-        self._nf_table.setItem(row, 0, QTableWidgetItem(track.get("title", "")))
-        self._nf_table.setItem(row, 1, QTableWidgetItem(track.get("artist", "")))
-        self._nf_table.setItem(row, 2, QTableWidgetItem(track.get("source_label", "")))
+        self._pending_not_found.append(track)
+        self._sync_flush_timer.start()
+
+    def _flush_sync_results(self) -> None:
+        """Insert all buffered sync tracks / not-found rows in one batch each."""
+        self._sync_flush_timer.stop()
+        tracks, self._pending_tracks = self._pending_tracks, []
+        entries = []
+        for track in tracks:
+            url    = track["url"]
+            title  = track.get("title", url)
+            artist = track.get("artist", "")
+            if artist:
+                title = f"{artist} — {title}"
+            entries.append((url, title, track.get("source_label", "Subscription")))
+        self._add_many_to_queue(entries)
+
+        not_found, self._pending_not_found = self._pending_not_found, []
+        if not not_found:
+            return
+        self._not_found.extend(not_found)
+        table = self._nf_table
+        first_row = table.rowCount()
+        table.setUpdatesEnabled(False)
+        table.setRowCount(first_row + len(not_found))
+        for row, track in enumerate(not_found, start=first_row):
+            table.setItem(row, 0, QTableWidgetItem(track.get("title", "")))
+            table.setItem(row, 1, QTableWidgetItem(track.get("artist", "")))
+            table.setItem(row, 2, QTableWidgetItem(track.get("source_label", "")))
+        table.setUpdatesEnabled(True)
 
     def _on_sync_all_done(self) -> None:
+        self._flush_sync_results()
         self.btn_sync.setEnabled(True)
-        found = len([item for item in self._queue
-                     if item["source_label"] != "Manual"])
+        found = self._queue_model.non_manual_count
         if found > 0:
             self._sync_status_lbl.setText(
                 f"✓ Sync complete — {found} new track(s) queued.")
@@ -1007,7 +1275,7 @@ class DownloadsTab(QWidget):
         self._sync_status_lbl.setWordWrap(True)
 
     def _on_retry_not_found(self) -> None:
-        rows = sorted({idx.row() for idx in self._nf_table.selectedIndexes()},
+        rows = sorted((idx.row() for idx in self._nf_table.selectionModel().selectedRows()),
                       reverse=True)
         for row in rows:
             if row < len(self._not_found):
@@ -1017,7 +1285,7 @@ class DownloadsTab(QWidget):
                 self._on_sync_new_track(track)
 
     def _on_remove_not_found(self) -> None:
-        rows = sorted({idx.row() for idx in self._nf_table.selectedIndexes()},
+        rows = sorted((idx.row() for idx in self._nf_table.selectionModel().selectedRows()),
                       reverse=True)
         for row in rows:
             if row < len(self._not_found):
@@ -1025,28 +1293,32 @@ class DownloadsTab(QWidget):
                 self._nf_table.removeRow(row)
 
     def _refresh_subscription_tables(self) -> None:
-        """Repopulate both subscription tables from config."""
+        """Repopulate the subscription tables from config."""
         self._yt_table.setRowCount(0)
         self._am_table.setRowCount(0)
         self._sp_table.setRowCount(0)
         for sub in self._config.get("subscriptions", []):
-            if sub.get("type") == "youtube":
-                self._add_yt_row(sub["url"], sub.get("label", sub["url"]))
-            elif sub.get("type") == "apple_music":
-                self._add_am_row(sub["playlist"])
-            elif sub.get("type") == "apple_music_url":
-                self._add_am_row(
-                    sub.get("label", sub["url"]),
-                    key=sub["url"],
-                    sub_type="apple_music_url",
-                    tooltip=sub["url"],
-                )
-            elif sub.get("type") == "spotify":
-                self._add_sp_row(
-                    sub.get("label", sub["url"]),
-                    url=sub["url"],
-                    tooltip=sub["url"],
-                )
+            self._add_subscription_row(sub)
+
+    def _add_subscription_row(self, sub: dict) -> None:
+        """Append one config subscription to the table for its type."""
+        if sub.get("type") == "youtube":
+            self._add_yt_row(sub["url"], sub.get("label", sub["url"]))
+        elif sub.get("type") == "apple_music":
+            self._add_am_row(sub["playlist"])
+        elif sub.get("type") == "apple_music_url":
+            self._add_am_row(
+                sub.get("label", sub["url"]),
+                key=sub["url"],
+                sub_type="apple_music_url",
+                tooltip=sub["url"],
+            )
+        elif sub.get("type") == "spotify":
+            self._add_sp_row(
+                sub.get("label", sub["url"]),
+                url=sub["url"],
+                tooltip=sub["url"],
+            )
 
     @staticmethod
     def _make_remove_btn() -> QPushButton:
@@ -1063,12 +1335,14 @@ class DownloadsTab(QWidget):
     def _add_yt_row(self, url: str, label: str) -> None:
         row = self._yt_table.rowCount()
         self._yt_table.insertRow(row)
-        self._yt_table.setItem(row, 0, QTableWidgetItem(label))
+        item = QTableWidgetItem(label)
+        item.setData(Qt.ItemDataRole.UserRole, ("youtube", url))
+        self._yt_table.setItem(row, 0, item)
         url_item = QTableWidgetItem(url)
         url_item.setToolTip(url)
         self._yt_table.setItem(row, 1, url_item)
         btn_rm = self._make_remove_btn()
-        btn_rm.clicked.connect(lambda: self._remove_subscription("youtube", url))
+        btn_rm.clicked.connect(partial(self._remove_subscription, "youtube", url))
         self._yt_table.setCellWidget(row, 2, btn_rm)
 
     def _add_am_row(
@@ -1081,14 +1355,15 @@ class DownloadsTab(QWidget):
         """Add a row to the Apple Music table. ``key`` is the removal key (playlist name or URL)."""
         row = self._am_table.rowCount()
         self._am_table.insertRow(row)
+        rm_key = key if key is not None else display
         item = QTableWidgetItem(display)
+        item.setData(Qt.ItemDataRole.UserRole, (sub_type, rm_key))
         if tooltip:
             item.setToolTip(tooltip)
         self._am_table.setItem(row, 0, item)
         btn_rm = self._make_remove_btn()
-        rm_key = key if key is not None else display
         btn_rm.clicked.connect(
-            lambda: self._remove_subscription(sub_type, rm_key))
+            partial(self._remove_subscription, sub_type, rm_key))
         self._am_table.setCellWidget(row, 1, btn_rm)
 
     def _add_sp_row(
@@ -1101,44 +1376,56 @@ class DownloadsTab(QWidget):
         row = self._sp_table.rowCount()
         self._sp_table.insertRow(row)
         item = QTableWidgetItem(display)
+        item.setData(Qt.ItemDataRole.UserRole, ("spotify", url))
         if tooltip:
             item.setToolTip(tooltip)
         self._sp_table.setItem(row, 0, item)
         btn_rm = self._make_remove_btn()
         btn_rm.clicked.connect(
-            lambda: self._remove_subscription("spotify", url))
+            partial(self._remove_subscription, "spotify", url))
         self._sp_table.setCellWidget(row, 1, btn_rm)
 
     def _remove_subscription(self, sub_type: str, key: str) -> None:
         subs = self._config.get("subscriptions", [])
-        if sub_type == "youtube":
-            self._config["subscriptions"] = [
-                s for s in subs
-                if not (s.get("type") == "youtube" and s.get("url") == key)
-            ]
-        elif sub_type == "apple_music_url":
-            self._config["subscriptions"] = [
-                s for s in subs
-                if not (s.get("type") == "apple_music_url" and s.get("url") == key)
-            ]
-        elif sub_type == "spotify":
-            self._config["subscriptions"] = [
-                s for s in subs
-                if not (s.get("type") == "spotify" and s.get("url") == key)
-            ]
+        # Apple Music XML playlists are keyed by name, every other type by URL
+        if sub_type not in ("youtube", "apple_music_url", "spotify"):
+            sub_type, field = "apple_music", "playlist"
         else:
-            self._config["subscriptions"] = [
-                s for s in subs
-                if not (s.get("type") == "apple_music" and s.get("playlist") == key)
-            ]
+            field = "url"
+        self._config["subscriptions"] = [
+            s for s in subs
+            if not (s.get("type") == sub_type and s.get(field) == key)
+        ]
         self._save_config()
-        self._refresh_subscription_tables()
+        # Drop only the matching rows; the other rows and their buttons stay put
+        table = {"youtube": self._yt_table, "spotify": self._sp_table}.get(
+            sub_type, self._am_table)
+        for row in range(table.rowCount() - 1, -1, -1):
+            item = table.item(row, 0)
+            if item is not None and item.data(Qt.ItemDataRole.UserRole) == (sub_type, key):
+                table.removeRow(row)
 
     def _build_sources(self) -> list:
-        """Build source objects from config subscriptions."""
+        """
+        Build source objects from config subscriptions. The list is reused
+        until the subscriptions or the Apple Music XML path change.
+        """
+        xml = self._config.get("apple_music_xml", "").strip()
+        subs = self._config.get("subscriptions", [])
+        key = (
+            tuple((s.get("type"), s.get("url"), s.get("playlist"), s.get("label"))
+                  for s in subs),
+            xml,
+        )
+        if key != self._sources_key:
+            self._sources = self._make_sources(subs, xml)
+            self._sources_key = key
+        return list(self._sources)
+
+    @staticmethod
+    def _make_sources(subs: list[dict], xml: str) -> list:
         sources = []
-        xml = self._xml_edit.text().strip()
-        for sub in self._config.get("subscriptions", []):
+        for sub in subs:
             if sub.get("type") == "youtube":
                 src = YouTubePlaylistSource(sub["url"], sub.get("label", sub["url"]))
                 sources.append(src)
@@ -1165,14 +1452,19 @@ class DownloadsTab(QWidget):
         else:
             self._start_watcher()
 
-    def _start_watcher(self) -> None:
-        watch_dir = self._watch_dir_edit.text().strip()
+    def _start_watcher(self, watch_dir: str | None = None) -> None:
+        """Start watching ``watch_dir`` (default: the folder field on the SoulSeek tab)."""
+        ui_built = _TAB_SOULSEEK not in self._tab_builders
+        if watch_dir is None:
+            watch_dir = self._watch_dir_edit.text().strip()
         if not watch_dir:
             self._watch_status_lbl.setText("Set a folder to watch first.")
             return
-        self._config["watch_dir"] = watch_dir
-        self._save_config()
-        if self._watcher.start(watch_dir):
+        self._set_config("watch_dir", watch_dir)
+        started = self._watcher.start(watch_dir)
+        if not ui_built:
+            return
+        if started:
             self.btn_watch_toggle.setText("⏹  Stop Watching")
             self._watch_status_lbl.setText(
                 f"● Watching: {watch_dir}")
@@ -1180,61 +1472,87 @@ class DownloadsTab(QWidget):
             self._watch_status_lbl.setText(
                 f"⚠  Folder not found: {watch_dir}")
 
-    def _on_file_detected(self, file_path: str) -> None:
-        p = Path(file_path)
-        try:
-            size_mb = p.stat().st_size / (1024 * 1024)
-        except OSError:
-            size_mb = 0.0
-
-        self._watcher_items.append(
-            {"file_path": file_path, "size_mb": size_mb, "imported": False}
-        )
-
-        row = self._ss_table.rowCount()
-        self._ss_table.insertRow(row)
-        self._ss_table.setItem(row, 0, QTableWidgetItem(p.name))
-        self._ss_table.setItem(row, 1, QTableWidgetItem(f"{size_mb:.1f} MB"))
-        status_item = QTableWidgetItem("New")
-        status_item.setForeground(_COLOR_ACTIVE)
+    def _on_file_detected(self, file_path: str, size_bytes: int = 0) -> None:
+        self._ss_pending[file_path] = size_bytes
+        if not self._ss_timer.isActive():
+            self._ss_timer.start()
+
+    def _flush_detected_files(self) -> None:
+        """Record the paths detected since the last flush, adding their rows in one batch."""
+        paths, self._ss_pending = self._ss_pending, {}
+        first = len(self._wi_paths)
+        for file_path, size_bytes in paths.items():
+            if not size_bytes:
+                # Created-event sizes are taken before the file is written;
+                # re-stat now that the folder has been quiet for a while
+                try:
+                    size_bytes = os.stat(file_path).st_size
+                except OSError:
+                    pass
+            self._wi_paths.append(file_path)
+            self._wi_sizes.append(size_bytes / (1024 * 1024))
+            self._wi_imported.append(0)
+        self._n_new_unimported += len(paths)
+        if _TAB_SOULSEEK in self._tab_builders or not paths:
+            return   # rows are added when the SoulSeek tab is first built
+        self._add_ss_rows(first)
+        self._update_watch_status()
+
+    def _add_ss_rows(self, first_idx: int) -> None:
+        """Append table rows for watcher items ``first_idx`` onwards."""
+        table = self._ss_table
+        count = len(self._wi_paths)
+        if first_idx >= count:
+            return
+        table.setUpdatesEnabled(False)
+        table.setRowCount(count)
+        for row in range(first_idx, count):
+            self._fill_ss_row(row)
+        table.setUpdatesEnabled(True)
+
+    def _fill_ss_row(self, item_idx: int) -> None:
+        """Populate row ``item_idx`` (watcher items and rows share indices)."""
+        row = item_idx
+        self._ss_table.setItem(
+            row, 0, QTableWidgetItem(Path(self._wi_paths[item_idx]).name))
+        self._ss_table.setItem(
+            row, 1, QTableWidgetItem(f"{self._wi_sizes[item_idx]:.1f} MB"))
+        if self._wi_imported[item_idx]:
+            status_item = QTableWidgetItem(_SS_IMPORTED)
+            status_item.setForeground(_BRUSH_DONE)
+            self._ss_table.setItem(row, 2, status_item)
+            return   # Action cell stays empty — no placeholder item needed
+        status_item = QTableWidgetItem(_SS_NEW)
+        status_item.setForeground(_BRUSH_ACTIVE)
         self._ss_table.setItem(row, 2, status_item)
 
         btn = QPushButton("⬆ Import")
         btn.setFixedHeight(22)
-        fp = file_path
-        item_idx = len(self._watcher_items) - 1
-        btn.clicked.connect(lambda: self._import_watcher_item(item_idx, row))
+        btn.clicked.connect(partial(self._import_watcher_item, item_idx, row))
         self._ss_table.setCellWidget(row, 3, btn)
 
-        # Update status label
-        n_new = sum(1 for it in self._watcher_items if not it["imported"])
+    def _update_watch_status(self) -> None:
         self._watch_status_lbl.setText(
-            f"● Watching — {n_new} new file(s) detected"
+            f"● Watching — {self._n_new_unimported} new file(s) detected"
         )
 
     def _import_watcher_item(self, item_idx: int, row: int) -> None:
-        if item_idx >= len(self._watcher_items):
-            return
-        item = self._watcher_items[item_idx]
-        if item["imported"]:
+        if item_idx >= len(self._wi_paths) or self._wi_imported[item_idx]:
             return
-        item["imported"] = True
-        status_item = QTableWidgetItem("✓ Imported")
-        status_item.setForeground(_COLOR_DONE)
-        self._ss_table.setItem(row, 2, status_item)
+        self._wi_imported[item_idx] = 1
+        self._n_new_unimported -= 1
+        # Restyle the existing status item in place rather than replacing it
+        status_item = self._ss_table.item(row, 2)
+        status_item.setText(_SS_IMPORTED)
+        status_item.setForeground(_BRUSH_DONE)
         self._ss_table.removeCellWidget(row, 3)
-        self._ss_table.setItem(row, 3, QTableWidgetItem(""))
-        self.import_requested.emit(item["file_path"])
+        self.import_requested.emit(self._wi_paths[item_idx])
 
     def _on_import_all_new(self) -> None:
-        for idx, item in enumerate(self._watcher_items):
-            if not item["imported"]:
-                # Find the corresponding table row
-                for row in range(self._ss_table.rowCount()):
-                    name_item = self._ss_table.item(row, 0)
-                    if name_item and name_item.text() == Path(item["file_path"]).name:
-                        self._import_watcher_item(idx, row)
-                        break
+        for idx, imported in enumerate(self._wi_imported):
+            if not imported:
+                # Watcher items and table rows share indices (see _fill_ss_row)
+                self._import_watcher_item(idx, idx)
 
     # ------------------------------------------------------------------
     # Folder browse helpers
@@ -1288,20 +1606,71 @@ class DownloadsTab(QWidget):
 
     def _load_config(self) -> None:
         try:
-            if CONFIG_FILE.exists():
-                with open(CONFIG_FILE) as f:
-                    self._config = json.load(f)
-        except Exception:
+            data = CONFIG_FILE.read_bytes()
+        except OSError:
+            return
+        try:
+            self._config = _parse_config(data)
+            # The file as read is what an unchanged config serialises to
+            self._config_bytes = data
+        except Exception as exc:
+            # Keep the unreadable file so the next save cannot wipe the user's
+            # subscriptions without a trace
+            print(f"[downloads_tab] Config unreadable, starting fresh: {exc}")
             self._config = {}
+            try:
+                os.replace(CONFIG_FILE, CONFIG_FILE.with_name(CONFIG_FILE.name + ".corrupt"))
+            except OSError:
+                pass
+
+    def _on_output_dir_edited(self, text: str) -> None:
+        self._set_config("yt_output_dir", text)
+
+    def _on_xml_path_edited(self, text: str) -> None:
+        self._set_config("apple_music_xml", text)
+
+    def _set_config(self, key: str, value) -> None:
+        """Assign a config value, scheduling a save only if it actually changed."""
+        if self._config.get(key) == value:
+            return
+        self._config[key] = value
+        self._save_config()
 
     def _save_config(self) -> None:
+        """Schedule a config write; bursts of edits collapse into one."""
+        self._save_timer.start()
+
+    def _flush_config(self, durable: bool = False) -> None:
+        """
+        Write the config now and cancel any pending scheduled write.
+        Every write is atomic (temp file + os.replace); only a durable flush,
+        done on close, also fsyncs so debounced saves stay cheap.
+        """
+        self._save_timer.stop()
+        data = _dump_config(self._config)
+        if data == self._config_bytes and not (durable and self._config_unsynced):
+            return
         try:
             CONFIG_FILE.parent.mkdir(parents=True, exist_ok=True)
-            with open(CONFIG_FILE, "w") as f:
-                json.dump(self._config, f, indent=2)
+            if data != self._config_bytes:
+                tmp = CONFIG_FILE.with_name(CONFIG_FILE.name + ".tmp")
+                tmp.write_bytes(data)
+                os.replace(tmp, CONFIG_FILE)
+                self._config_bytes = data
+                self._config_unsynced = True
+            if durable:
+                with open(CONFIG_FILE, "rb+") as f:
+                    os.fsync(f.fileno())
+                self._config_unsynced = False
         except Exception as exc:
             print(f"[downloads_tab] Could not save config: {exc}")
 
+    def _on_about_to_quit(self) -> None:
+        # This tab lives inside the main window's QTabWidget, so it never
+        # receives a closeEvent of its own; app shutdown is the hook.
+        self._ffmpeg_probe.wait()
+        self._flush_config(durable=True)
+
     # ------------------------------------------------------------------
     # Startup sync (called by MainWindow after 2s delay)
     # ------------------------------------------------------------------
@@ -1311,8 +1680,9 @@ class DownloadsTab(QWidget):
         sources = self._build_sources()
         if not sources:
             return
+        self._ensure_tab(_TAB_SUBS)   # sync results land in its widgets
         worker = PlaylistSyncWorker(sources, load_sync_state())
-        worker.new_track.connect(self._on_sync_new_track)
+        worker.new_tracks_batch.connect(self._on_sync_new_tracks)
         worker.track_not_found.connect(self._on_sync_not_found)
         worker.source_error.connect(self._on_sync_source_error)
         worker.all_done.connect(self._on_sync_all_done)
@@ -1323,26 +1693,9 @@ class DownloadsTab(QWidget):
     # Internal helpers
     # ------------------------------------------------------------------
 
-    def _row_for_active_url(self, url: str) -> int:
-        """Find the table row for the currently downloading URL."""
-        for row in range(self._queue_table.rowCount()):
-            title_item = self._queue_table.item(row, 0)
-            if title_item and title_item.toolTip() == url:
-                return row
-        return -1
-
-    def _row_for_queue_idx(self, idx: int) -> int:
-        """Find table row by queue index stored in item UserRole."""
-        for row in range(self._queue_table.rowCount()):
-            title_item = self._queue_table.item(row, 0)
-            if title_item and title_item.data(Qt.ItemDataRole.UserRole) == idx:
-                return row
-        return -1
-
-    def _queue_idx_for_row(self, row: int) -> int:
-        title_item = self._queue_table.item(row, 0)
-        if title_item:
-            val = title_item.data(Qt.ItemDataRole.UserRole)
-            if isinstance(val, int):
-                return val
-        return -1
+    def _active_item(self, url: str | None) -> dict | None:
+        """Queue item of the running download, if ``url`` is the one running."""
+        item = self._active
+        if url is None or url != self._active_url or item is None:
+            return None
+        return item if item["status"] == _STATUS_DOWNLOADING else None
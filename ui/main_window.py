@@ -4,24 +4,27 @@ PyQt6-based desktop application for browsing and analyzing DJ tracks.
 """
 
 import os
-import sys
 import json
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QSplitter,
-    QPushButton, QLabel, QLineEdit, QTableWidget, QTableWidgetItem,
+    QPushButton, QLabel, QLineEdit, QTableWidget, QTableWidgetItem, QTableView,
     QFileDialog, QHeaderView, QProgressBar, QStatusBar, QSlider,
     QMenu, QApplication, QComboBox, QInputDialog, QAbstractItemView,
-    QDialog, QScrollArea, QTabWidget, QSystemTrayIcon,
+    QDialog, QScrollArea, QTabWidget, QSystemTrayIcon, QCheckBox,
+)
+from PyQt6.QtCore import (
+    Qt, QThread, pyqtSignal, QPoint, QTimer, QObject, QRunnable, QThreadPool,
+    QAbstractItemModel, QAbstractTableModel, QModelIndex, QMimeData, QSortFilterProxyModel,
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QPoint, QTimer
 from PyQt6.QtGui import QColor, QAction, QKeyEvent, QShortcut, QKeySequence, QIcon
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-from analyzer.audio_analyzer import AudioAnalyzer
-from analyzer.batch_analyzer import BatchAnalyzer, is_cached, load_cached
+from analyzer.batch_analyzer import BatchAnalyzer, cache_listing, load_cached, shutdown_pool
+from analyzer.quick_probe import read_audio_info
 from analyzer.genre_detector import (
     GenreDetector, ensure_models, load_genre_cache, save_genre_cache,
 )
@@ -39,7 +42,8 @@ ROW_PENDING   = QColor(30,  30,  45)
 ROW_ANALYZING = QColor(10,  30,  70)
 ROW_DONE      = QColor(15,  15,  28)
 
-AUDIO_EXTS = {'.mp3', '.wav', '.flac', '.m4a', '.ogg', '.aiff', '.aif'}
+AUDIO_EXTS = frozenset({'.mp3', '.wav', '.flac', '.m4a', '.ogg', '.aiff', '.aif'})
+_AUDIO_SUFFIXES = tuple(AUDIO_EXTS)   # for str.endswith
 PLAYLISTS_FILE = _get_data_dir() / 'playlists.json'
 HOT_CUES_FILE  = _get_data_dir() / 'hot_cues.json'
 
@@ -59,13 +63,309 @@ for _i in range(1, 13):
     _CAMELOT_ORDER[f"{_i}B"] = (_i - 1) * 2 + 1
 
 
+def _iter_audio_files(root: str):
+    """
+    Yield the paths of audio files under ``root``, recursively. Entries are
+    classified from the scandir listing (no extra stat on most platforms) and
+    unreadable directories are skipped, as os.walk does.
+    """
+    try:
+        it = os.scandir(root)
+    except OSError:
+        return
+    with it:
+        for entry in it:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _iter_audio_files(entry.path)
+                elif entry.name.lower().endswith(_AUDIO_SUFFIXES) and entry.is_file():
+                    yield entry.path
+            except OSError:
+                continue
+
+
 def _camelot_sort_key(camelot: str) -> int:
     """Return integer sort key for a Camelot string (1A–12B). Unknown → 24."""
     return _CAMELOT_ORDER.get(camelot, 24)
 
 
-class DraggableLibraryTable(QTableWidget):
-    """Library table that drags the selected track's file path as text/plain MIME."""
+_LOW_BITRATE_COLOR = QColor("#FF8C00")
+
+
+def _is_low_bitrate(r: dict) -> bool:
+    return 0 < r['bitrate'] < 320
+
+
+# Library sort key per column: numbers for BPM / Key / Nrg, the displayed text elsewhere
+_LIBRARY_SORT_KEYS = (
+    lambda r: f"⚑ {r['name']}" if _is_low_bitrate(r) else r['name'],
+    lambda r: float(r['bpm']) if r['bpm'] else 999.0,
+    lambda r: _camelot_sort_key(r['camelot'] or "--"),
+    lambda r: int(r['energy']) if r['energy'] else 0,
+    lambda r: r['genre'],
+    lambda r: "\u2713" if r['analyzed'] else "\u00b7",
+)
+
+
+class LibraryModel(QAbstractTableModel):
+    """
+    Track library as a plain list of row dicts. Cells are produced on demand
+    by data(), so only the rows on screen cost anything to display.
+    Column 0's UserRole is the file path, as it was for the old table items.
+
+    Sorting reorders the rows themselves with one keyed list.sort, and the
+    order is kept as rows arrive or change. Sorting in the proxy instead
+    would call data() from C++ for every comparison (~4 s for 40k rows).
+    """
+
+    HEADERS = ["Track", "BPM", "Key", "Nrg", "Genre", "\u2713"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: list[dict] = []
+        self._row_of: dict[str, int] = {}   # file_path → row
+        self._sort_column = -1
+        self._sort_order = Qt.SortOrder.AscendingOrder
+
+    @staticmethod
+    def _new_row(file_path: str) -> dict:
+        # os.path rather than Path(...).stem: this runs once per library track
+        name = os.path.splitext(os.path.basename(file_path))[0]
+        return {
+            'file_path': file_path,
+            'name':      name,
+            'name_lower': name.lower(),   # search filter key
+            'bpm':       None,
+            'camelot':   None,
+            'energy':    None,
+            'genre':     "",
+            'analyzed':  False,
+            'bitrate':   0,
+            'bg':        None,
+        }
+
+    # ── Qt model interface ─────────────────────────────────────────────
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if (orientation == Qt.Orientation.Horizontal
+                and role == Qt.ItemDataRole.DisplayRole):
+            return self.HEADERS[section]
+        return None
+
+    def flags(self, index):
+        return (Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+                | Qt.ItemFlag.ItemIsDragEnabled)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        r   = self._rows[index.row()]
+        col = index.column()
+        low_br = _is_low_bitrate(r)
+        if role == Qt.ItemDataRole.DisplayRole:
+            if col == 0:
+                return f"⚑ {r['name']}" if low_br else r['name']
+            if col == 1:
+                return str(r['bpm']) if r['bpm'] else "--"
+            if col == 2:
+                return r['camelot'] or "--"
+            if col == 3:
+                return str(r['energy']) if r['energy'] else "--"
+            if col == 4:
+                return r['genre']
+            return "\u2713" if r['analyzed'] else "\u00b7"
+        if role == Qt.ItemDataRole.UserRole and col == 0:
+            return r['file_path']
+        if role == Qt.ItemDataRole.BackgroundRole:
+            return r['bg']
+        if role == Qt.ItemDataRole.ForegroundRole and col == 0 and low_br:
+            return _LOW_BITRATE_COLOR
+        if role == Qt.ItemDataRole.ToolTipRole:
+            if col == 0:
+                if low_br:
+                    return (f"Low bitrate: {r['bitrate']} kbps (< 320 kbps)\n"
+                            f"{r['file_path']}")
+                return r['file_path']
+            if col == 4 and r['genre']:
+                return r['genre']
+        return None
+
+    def sort(self, column: int, order=Qt.SortOrder.AscendingOrder) -> None:
+        self._sort_column = column
+        self._sort_order = order
+        self._resort()
+
+    def mimeTypes(self) -> list[str]:
+        return ["text/plain"]
+
+    def mimeData(self, indexes) -> QMimeData:
+        """Drag the selected tracks' file paths as newline-separated text."""
+        data = QMimeData()
+        rows = sorted({idx.row() for idx in indexes})
+        paths = [self._rows[row]['file_path'] for row in rows]
+        if paths:
+            data.setText("\n".join(paths))
+        return data
+
+    # ── Library operations ─────────────────────────────────────────────
+
+    def __contains__(self, file_path: str) -> bool:
+        return file_path in self._row_of
+
+    def set_tracks(self, file_paths: list[str]) -> None:
+        """Replace the whole library in one model reset."""
+        self.beginResetModel()
+        self._rows = [self._new_row(fp) for fp in file_paths]
+        self._row_of = {fp: i for i, fp in enumerate(file_paths)}
+        self.endResetModel()
+
+    def append_tracks(self, file_paths: list[str], results: dict | None = None) -> None:
+        """
+        Append rows in one insertion; ``results`` maps path → cached analysis to show.
+        New rows land at the end even under an active sort: callers call resort()
+        once they are done adding (a folder scan appends many batches).
+        """
+        if not file_paths:
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(file_paths) - 1)
+        for row, fp in enumerate(file_paths, start=first):
+            self._rows.append(self._new_row(fp))
+            self._row_of[fp] = row
+            if results and results.get(fp):
+                self.apply_results(fp, results[fp], notify=False)
+        self.endInsertRows()
+
+    def resort(self) -> None:
+        """Re-apply the current sort (no-op when unsorted)."""
+        self._resort()
+
+    def clear(self) -> None:
+        self.set_tracks([])
+
+    def apply_results(self, file_path: str, results: dict, notify: bool = True) -> None:
+        """Fill BPM / Key / Nrg / ✓ / bitrate from analysis results."""
+        row = self._row_of.get(file_path)
+        if row is None:
+            return
+        r = self._rows[row]
+        r['bpm']      = results.get('bpm')
+        r['camelot']  = results.get('key', {}).get('camelot', '--')
+        r['energy']   = results.get('energy', {}).get('level')
+        r['analyzed'] = True
+        r['bitrate']  = results.get('audio_info', {}).get('bitrate', 0) or 0
+        r['bg']       = ROW_DONE
+        if notify:
+            self._row_changed(row)
+            self._resort_if_sorted_by(0, 1, 2, 3, 5)
+
+    def apply_results_many(self, results: dict[str, dict]) -> None:
+        """apply_results for each path → results, then one dataChanged over the touched rows."""
+        rows = [self._row_of[fp] for fp in results if fp in self._row_of]
+        for fp, res in results.items():
+            self.apply_results(fp, res, notify=False)
+        if rows:
+            self.dataChanged.emit(
+                self.index(min(rows), 0),
+                self.index(max(rows), len(self.HEADERS) - 1))
+            self._resort_if_sorted_by(0, 1, 2, 3, 5)
+
+    def set_audio_info_many(self, infos: dict[str, dict]) -> None:
+        """Show probed bitrates for rows not analysed yet; analysis results win."""
+        rows = []
+        for fp, info in infos.items():
+            row = self._row_of.get(fp)
+            if row is None or self._rows[row]['analyzed']:
+                continue
+            self._rows[row]['bitrate'] = info.get('bitrate', 0) or 0
+            rows.append(row)
+        if rows:
+            # Only the Track cell depends on bitrate (⚑ prefix, colour, tooltip)
+            self.dataChanged.emit(self.index(min(rows), 0), self.index(max(rows), 0))
+            self._resort_if_sorted_by(0)
+
+    def set_genre(self, file_path: str, genre: str) -> None:
+        row = self._row_of.get(file_path)
+        if row is not None:
+            self._rows[row]['genre'] = genre
+            self._row_changed(row)
+            self._resort_if_sorted_by(4)
+
+    def set_background(self, file_path: str, color: QColor) -> None:
+        row = self._row_of.get(file_path)
+        if row is not None:
+            self._rows[row]['bg'] = color
+            self._row_changed(row, [Qt.ItemDataRole.BackgroundRole])
+
+    def all_changed(self) -> None:
+        if self._rows:
+            self.dataChanged.emit(
+                self.index(0, 0),
+                self.index(len(self._rows) - 1, len(self.HEADERS) - 1))
+
+    def _resort_if_sorted_by(self, *columns: int) -> None:
+        if self._sort_column in columns:
+            self._resort()
+
+    def _resort(self) -> None:
+        """Reorder rows by the current sort, keeping persistent indexes (selection) attached."""
+        if not 0 <= self._sort_column < len(self.HEADERS) or len(self._rows) < 2:
+            return
+        key = _LIBRARY_SORT_KEYS[self._sort_column]
+        hint = QAbstractItemModel.LayoutChangeHint.VerticalSortHint
+        self.layoutAboutToBeChanged.emit([], hint)
+        # Sort row numbers, not rows, to get the old → new mapping; stable either way
+        rows = self._rows
+        keys = [key(r) for r in rows]
+        order = sorted(range(len(rows)), key=keys.__getitem__,
+                       reverse=self._sort_order == Qt.SortOrder.DescendingOrder)
+        new_row = [0] * len(rows)
+        for new, old in enumerate(order):
+            new_row[old] = new
+        self._rows = [rows[old] for old in order]
+        self._row_of = {r['file_path']: i for i, r in enumerate(self._rows)}
+        old_indexes = self.persistentIndexList()
+        self.changePersistentIndexList(
+            old_indexes,
+            [self.index(new_row[idx.row()], idx.column()) for idx in old_indexes])
+        self.layoutChanged.emit([], hint)
+
+    def _row_changed(self, row: int, roles: list | None = None) -> None:
+        """One dataChanged for the whole row; ``roles`` narrows what views refetch."""
+        self.dataChanged.emit(
+            self.index(row, 0), self.index(row, len(self.HEADERS) - 1), roles or [])
+
+
+class LibraryFilterProxy(QSortFilterProxyModel):
+    """
+    Filter proxy that matches the search text against each row's lowercased
+    name. Sorting is handed to LibraryModel, so the proxy keeps source order.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._needle = ""
+
+    def set_needle(self, text: str) -> None:
+        self._needle = text.lower()
+        self.invalidateFilter()
+
+    def sort(self, column: int, order=Qt.SortOrder.AscendingOrder) -> None:
+        self.sourceModel().sort(column, order)
+
+    def filterAcceptsRow(self, source_row: int, source_parent) -> bool:
+        return (not self._needle
+                or self._needle in self.sourceModel()._rows[source_row]['name_lower'])
+
+
+class DraggableLibraryTable(QTableView):
+    """Library view that drags the selected tracks' file paths as text/plain MIME."""
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -73,21 +373,6 @@ class DraggableLibraryTable(QTableWidget):
         self.setDragDropMode(QAbstractItemView.DragDropMode.DragOnly)
         self.setDefaultDropAction(Qt.DropAction.CopyAction)
 
-    def mimeData(self, items):
-        data = super().mimeData(items)
-        if items:
-            rows = sorted({item.row() for item in items})
-            paths = []
-            for row in rows:
-                fp_item = self.item(row, 0)
-                if fp_item:
-                    fp = fp_item.data(Qt.ItemDataRole.UserRole)
-                    if fp:
-                        paths.append(str(fp))
-            if paths:
-                data.setText("\n".join(paths))
-        return data
-
 
 class PlaylistDropTable(QTableWidget):
     """Playlist table that accepts file path drops from DraggableLibraryTable."""
@@ -321,21 +606,32 @@ class NumericTableWidgetItem(QTableWidgetItem):
 # Background threads
 # ---------------------------------------------------------------------------
 
-class AnalysisThread(QThread):
-    """Single-track analysis thread."""
-    finished = pyqtSignal(dict)
-    error    = pyqtSignal(str)
+class AnalysisSignals(QObject):
+    """Results of AnalysisTask, tagged with the request id that started it."""
+    finished = pyqtSignal(int, dict)
+    error    = pyqtSignal(int, str)
+
 
-    def __init__(self, file_path: str):
+class AnalysisTask(QRunnable):
+    """
+    Single-track analysis, run on the window's one-thread QThreadPool with
+    the window's shared AudioAnalyzer. Results go out through a long-lived
+    AnalysisSignals object; the request id lets the window drop stale ones.
+    """
+
+    def __init__(self, request_id: int, file_path: str, analyzer, signals: AnalysisSignals):
         super().__init__()
+        self._request_id = request_id
         self.file_path = file_path
-        self._analyzer = AudioAnalyzer()
+        self._analyzer = analyzer
+        self._signals = signals
 
     def run(self):
         try:
-            self.finished.emit(self._analyzer.analyze_track(self.file_path))
+            self._signals.finished.emit(
+                self._request_id, self._analyzer.analyze_track(self.file_path))
         except Exception as e:
-            self.error.emit(str(e))
+            self._signals.error.emit(self._request_id, str(e))
 
 
 class BatchThread(QThread):
@@ -362,6 +658,117 @@ class BatchThread(QThread):
         self._batch.cancel()
 
 
+def _load_cached_path(file_path: str, listing: frozenset[str] | None = None) -> dict | None:
+    try:
+        return load_cached(Path(file_path), listing)
+    except OSError:
+        return None   # file vanished between the scan and the cache lookup
+
+
+class ScanThread(QThread):
+    """
+    Finds the audio files under a folder and loads their cached analysis off
+    the main thread, streaming (file_path, cached results or None) batches.
+    """
+    batch = pyqtSignal(list)
+    done  = pyqtSignal(int)   # total files found
+
+    BATCH_SIZE = 256
+    CACHE_READERS = 8   # threads overlapping the cache file stat/open/read
+
+    def __init__(self, folder: str, parent=None):
+        super().__init__(parent)
+        self._folder = folder
+
+    def run(self):
+        files = []
+        for path in _iter_audio_files(self._folder):
+            if self.isInterruptionRequested():
+                return
+            files.append(path)
+        # Sort by path components (as Path ordering does), not raw string
+        files.sort(key=lambda p: p.split(os.sep))
+        # One directory read instead of a failed open per unanalysed track
+        load = partial(_load_cached_path, listing=cache_listing())
+        with ThreadPoolExecutor(max_workers=self.CACHE_READERS) as pool:
+            for start in range(0, len(files), self.BATCH_SIZE):
+                if self.isInterruptionRequested():
+                    return
+                chunk = files[start:start + self.BATCH_SIZE]
+                # map() keeps library order within the batch
+                self.batch.emit(list(zip(chunk, pool.map(load, chunk))))
+        self.done.emit(len(files))
+
+
+def _probe_path(file_path: str) -> dict | None:
+    try:
+        return read_audio_info(Path(file_path))
+    except OSError:
+        return None
+
+
+class ProbeThread(QThread):
+    """
+    Reads header-level audio info (bitrate etc., no decode) for tracks that
+    have no cached analysis, streaming (file_path, audio_info) batches.
+    """
+    batch = pyqtSignal(list)
+
+    BATCH_SIZE = 256
+    PROBE_READERS = 8
+
+    def __init__(self, file_paths: list[str], parent=None):
+        super().__init__(parent)
+        self._paths = file_paths
+
+    def run(self):
+        with ThreadPoolExecutor(max_workers=self.PROBE_READERS) as pool:
+            for start in range(0, len(self._paths), self.BATCH_SIZE):
+                if self.isInterruptionRequested():
+                    return
+                chunk = self._paths[start:start + self.BATCH_SIZE]
+                self.batch.emit([(fp, info) for fp, info
+                                 in zip(chunk, pool.map(_probe_path, chunk)) if info])
+
+
+class ExportThread(QThread):
+    """
+    Copies a playlist's files into a folder, reporting (done, total) after
+    each file. shutil.copy2 already takes the OS fast path (sendfile on
+    Linux, fcopyfile on macOS, CopyFile2 on Windows). Each file is copied
+    under a temporary name and renamed into place, so an interrupted export
+    leaves no partial tracks; interruption is checked between files.
+    """
+    progress = pyqtSignal(int, int)
+    done     = pyqtSignal(int, int, int)   # copied, skipped, errors
+
+    def __init__(self, file_paths: list[str], out_dir: Path, parent=None):
+        super().__init__(parent)
+        self._paths = file_paths
+        self._out_dir = out_dir
+
+    def run(self):
+        copied = skipped = errors = 0
+        total = len(self._paths)
+        for i, track_path in enumerate(self._paths, 1):
+            if self.isInterruptionRequested():
+                return
+            src = Path(track_path)
+            if src.exists():
+                tmp = self._out_dir / f".{src.name}.part"
+                try:
+                    shutil.copy2(src, tmp)
+                    os.replace(tmp, self._out_dir / src.name)
+                    copied += 1
+                except OSError:
+                    tmp.unlink(missing_ok=True)
+                    errors += 1
+            else:
+                skipped += 1
+            self.progress.emit(i, total)
+        self.done.emit(copied, skipped, errors)
+
+
 class GenreWorker(QThread):
     """
     Background thread that runs Essentia Discogs-EffNet genre detection.
@@ -457,13 +864,31 @@ class MainWindow(QMainWindow):
 
         self.current_track: dict | None = None
         self.library_files: list = []
-        self.analysis_thread: AnalysisThread | None = None
+        self.analyzer = None   # AudioAnalyzer, created on first analysis (see _ensure_analyzer)
+        # Single-track analysis: one worker, newest request wins (see _start_analysis)
+        self._analysis_pool = QThreadPool(self)
+        self._analysis_pool.setMaxThreadCount(1)
+        self._analysis_pool.setExpiryTimeout(-1)
+        self._analysis_signals = AnalysisSignals(self)
+        self._analysis_signals.finished.connect(self._on_analysis_done)
+        self._analysis_signals.error.connect(self._on_analysis_error)
+        self._analysis_request = 0
+        # "Analyze All" worker processes outlive each run; stop them with the app
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(shutdown_pool)
         self.batch_thread: BatchThread | None = None
+        self._scan_thread: ScanThread | None = None
+        self._probe_thread: ProbeThread | None = None
+        self._export_thread: ExportThread | None = None
+        self._unprobed: list[str] = []   # scanned tracks with no cached analysis
         self._genre_worker: GenreWorker | None = None
-        self._row_map: dict = {}   # file_path (str) -> table row index (int)
         self._seek_dragging = False
         self._playlists: list = []   # list of {"name": str, "tracks": [str]}
         self._hot_cues: list = [None] * 6   # each: None or {'position': float (0-1)}
+        # Parsed HOT_CUES_FILE, re-read only when its mtime changes
+        self._hot_cues_db: dict = {}
+        self._hot_cues_mtime: int | None = None
         self._loop_a: float | None = None
         self._loop_b: float | None = None
         self._loop_active: bool = False
@@ -475,6 +900,21 @@ class MainWindow(QMainWindow):
         self.audio_player.playback_finished.connect(self._on_playback_finished)
         self.audio_player.set_volume(0.7)
 
+        # Playhead repaint, only while audio is running (see _on_position_changed)
+        self._playhead_timer = QTimer(self)
+        self._playhead_timer.setInterval(50)
+        self._playhead_timer.timeout.connect(self._refresh_playhead)
+        self._playhead_ms: int = -1   # last playhead position drawn, in track milliseconds
+        self._time_label_secs: tuple[int, int] | None = None   # (current, total) shown in lbl_time
+
+        # Batch analysis results and progress are applied at most ~30×/s
+        self._pending_updates: dict[str, dict] = {}   # file_path → results
+        self._pending_progress: tuple[int, int] | None = None
+        self._batch_flush_timer = QTimer(self)
+        self._batch_flush_timer.setSingleShot(True)
+        self._batch_flush_timer.setInterval(33)
+        self._batch_flush_timer.timeout.connect(self._flush_batch_updates)
+
         self.setWindowTitle("TrackFlow")
         self.setMinimumSize(1200, 720)
         self.resize(1400, 820)
@@ -635,7 +1075,12 @@ class MainWindow(QMainWindow):
         self.btn_load_folder.clicked.connect(self._load_folder)
         self.btn_clear_library.clicked.connect(self._clear_library)
         self.btn_analyze_all.clicked.connect(self._analyze_all)
-        self.search_box.textChanged.connect(self._filter_tracks)
+        # Coalesce fast typing into one filter pass
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(100)
+        self._filter_timer.timeout.connect(self._filter_tracks)
+        self.search_box.textChanged.connect(self._filter_timer.start)
 
         return lay
 
@@ -649,14 +1094,15 @@ class MainWindow(QMainWindow):
         header.setObjectName("section_header")
         lay.addWidget(header)
 
+        self.track_model = LibraryModel(self)
+        self.track_proxy = LibraryFilterProxy(self)
+        self.track_proxy.setSourceModel(self.track_model)
+
         self.track_table = DraggableLibraryTable()
-        self.track_table.setColumnCount(6)
-        self.track_table.setHorizontalHeaderLabels(
-            ["Track", "BPM", "Key", "Nrg", "Genre", "\u2713"]
-        )
-        self.track_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.track_table.setSelectionMode(QTableWidget.SelectionMode.ExtendedSelection)
-        self.track_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.track_table.setModel(self.track_proxy)
+        self.track_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.track_table.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+        self.track_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self.track_table.setAlternatingRowColors(True)
         self.track_table.verticalHeader().setVisible(False)
         self.track_table.setShowGrid(False)
@@ -677,12 +1123,9 @@ class MainWindow(QMainWindow):
 
         self.track_table.verticalHeader().setDefaultSectionSize(22)
 
-        self.track_table.itemSelectionChanged.connect(self._on_track_selected)
+        self.track_table.selectionModel().selectionChanged.connect(self._on_track_selected)
         self.track_table.customContextMenuRequested.connect(self._library_context_menu)
         self.track_table.setSortingEnabled(True)
-        self.track_table.horizontalHeader().sortIndicatorChanged.connect(
-            lambda *_: self._rebuild_row_map()
-        )
 
         lay.addWidget(self.track_table)
 
@@ -895,7 +1338,7 @@ class MainWindow(QMainWindow):
         lay.setContentsMargins(0, 4, 0, 0)
         lay.setSpacing(4)
 
-        # Top bar: button + status label
+        # Top bar: button + compatible-only toggle + status label
         top = QHBoxLayout()
         self.btn_find_similar = QPushButton("Find Similar")
         self.btn_find_similar.setFixedHeight(28)
@@ -904,6 +1347,12 @@ class MainWindow(QMainWindow):
         self.btn_find_similar.clicked.connect(self._run_find_similar)
         top.addWidget(self.btn_find_similar)
 
+        self.chk_similar_compatible = QCheckBox("Compatible only")
+        self.chk_similar_compatible.setToolTip(
+            "Only show tracks within a few BPM on the same or an adjacent Camelot key"
+        )
+        top.addWidget(self.chk_similar_compatible)
+
         self.lbl_similar_status = QLabel("Load and analyze a track to find similar ones")
         self.lbl_similar_status.setObjectName("meta_text")
         top.addWidget(self.lbl_similar_status, stretch=1)
@@ -946,6 +1395,7 @@ class MainWindow(QMainWindow):
         lay.addWidget(lbl)
 
         self._cue_buttons: list = []
+        self._cue_menus: list = []     # one persistent "Clear cue" menu per button
         for i in range(6):
             btn = QPushButton(str(i + 1))
             btn.setFixedSize(44, 26)
@@ -957,6 +1407,11 @@ class MainWindow(QMainWindow):
             )
             self._cue_buttons.append(btn)
             lay.addWidget(btn)
+            menu = QMenu(self)
+            menu.addAction(f"Clear cue {i + 1}").triggered.connect(
+                lambda checked, idx=i: self._clear_cue(idx)
+            )
+            self._cue_menus.append(menu)
 
         lay.addStretch()
         return row_widget
@@ -1034,8 +1489,7 @@ class MainWindow(QMainWindow):
         """Load playlists from JSON on startup."""
         try:
             if PLAYLISTS_FILE.exists():
-                with open(PLAYLISTS_FILE) as f:
-                    data = json.load(f)
+                data = json.loads(PLAYLISTS_FILE.read_bytes())
                 self._playlists = data.get('playlists', [])
         except Exception as e:
             print(f"Could not load playlists: {e}")
@@ -1077,15 +1531,13 @@ class MainWindow(QMainWindow):
     def _cue_context_menu(self, idx: int, pos) -> None:
         if self._hot_cues[idx] is None:
             return
-        menu = QMenu(self)
-        action_clear = menu.addAction(f"Clear cue {idx + 1}")
-        btn = self._cue_buttons[idx]
-        action = menu.exec(btn.mapToGlobal(pos))
-        if action == action_clear:
-            self._hot_cues[idx] = None
-            self._save_hot_cues()
-            self._refresh_cue_buttons()
-            self._refresh_waveform_overlays()
+        self._cue_menus[idx].exec(self._cue_buttons[idx].mapToGlobal(pos))
+
+    def _clear_cue(self, idx: int) -> None:
+        self._hot_cues[idx] = None
+        self._save_hot_cues()
+        self._refresh_cue_buttons()
+        self._refresh_waveform_overlays()
 
     def _refresh_cue_buttons(self) -> None:
         for i, (btn, cue) in enumerate(zip(self._cue_buttons, self._hot_cues)):
@@ -1249,17 +1701,26 @@ class MainWindow(QMainWindow):
         self.btn_loop_b.setStyleSheet(green_style if self._loop_active else base_style)
         # LOOP toggle: enabled only when both are set; green when looping
 
+    def _hot_cues_all(self) -> dict:
+        """All saved cues ({file_path: cues}); the file is parsed again only if it changed."""
+        try:
+            mtime = HOT_CUES_FILE.stat().st_mtime_ns
+        except OSError:
+            self._hot_cues_db, self._hot_cues_mtime = {}, None
+            return self._hot_cues_db
+        if mtime != self._hot_cues_mtime:
+            self._hot_cues_db = json.loads(HOT_CUES_FILE.read_bytes())
+            self._hot_cues_mtime = mtime
+        return self._hot_cues_db
+
     def _load_hot_cues(self, file_path: str) -> None:
         """Load saved cues for this track from disk."""
         self._hot_cues = [None] * 6
         try:
-            if HOT_CUES_FILE.exists():
-                with open(HOT_CUES_FILE) as f:
-                    data = json.load(f)
-                saved = data.get(file_path, [None] * 6)
-                for i, c in enumerate(saved[:6]):
-                    if isinstance(c, dict) and 'position' in c:
-                        self._hot_cues[i] = {'position': float(c['position'])}
+            saved = self._hot_cues_all().get(file_path, [None] * 6)
+            for i, c in enumerate(saved[:6]):
+                if isinstance(c, dict) and 'position' in c:
+                    self._hot_cues[i] = {'position': float(c['position'])}
         except Exception as e:
             print(f"Could not load hot cues: {e}")
 
@@ -1270,13 +1731,12 @@ class MainWindow(QMainWindow):
         fp = self.current_track['file_path']
         try:
             HOT_CUES_FILE.parent.mkdir(parents=True, exist_ok=True)
-            existing: dict = {}
-            if HOT_CUES_FILE.exists():
-                with open(HOT_CUES_FILE) as f:
-                    existing = json.load(f)
-            existing[fp] = self._hot_cues
-            with open(HOT_CUES_FILE, 'w') as f:
-                json.dump(existing, f, indent=2)
+            existing = self._hot_cues_all()
+            existing[fp] = list(self._hot_cues)
+            tmp = HOT_CUES_FILE.with_name(HOT_CUES_FILE.name + ".tmp")
+            tmp.write_text(json.dumps(existing, indent=2))
+            os.replace(tmp, HOT_CUES_FILE)
+            self._hot_cues_mtime = HOT_CUES_FILE.stat().st_mtime_ns
         except Exception as e:
             print(f"Could not save hot cues: {e}")
 
@@ -1293,19 +1753,11 @@ class MainWindow(QMainWindow):
             return
 
         # Add all selected files that aren't already in the library
-        new_paths = [p for p in paths if p not in self._row_map]
+        new_paths = list(dict.fromkeys(p for p in paths if p not in self.track_model))
         if new_paths:
-            self.track_table.setSortingEnabled(False)
-            try:
-                for path in new_paths:
-                    row = self.track_table.rowCount()
-                    self.track_table.insertRow(row)
-                    self._set_row(row, path)
-                    self._row_map[path] = row
-                    self.library_files.append(path)
-            finally:
-                self.track_table.setSortingEnabled(True)
-                self._rebuild_row_map()
+            self.track_model.append_tracks(new_paths)
+            self.track_model.resort()
+            self.library_files.extend(new_paths)
             self.track_count_label.setText(f"{len(self.library_files)} tracks")
 
         # Analyze and display the last selected file
@@ -1315,32 +1767,77 @@ class MainWindow(QMainWindow):
         folder = QFileDialog.getExistingDirectory(self, "Select Music Folder")
         if not folder:
             return
-        files = [
-            str(p) for p in sorted(Path(folder).rglob('*'))
-            if p.is_file() and p.suffix.lower() in AUDIO_EXTS
-        ]
-        if not files:
+
+        self._cancel_scan()
+        self.library_files = []
+        self.track_model.clear()
+        self.track_count_label.setText("0 tracks")
+        self.btn_analyze_all.setEnabled(False)
+        self._status.showMessage(f"Scanning {folder}\u2026")
+
+        # Parented, so a cancelled scan can outlive our reference until it returns
+        thread = ScanThread(folder, self)
+        thread.batch.connect(self._on_scan_batch)
+        thread.done.connect(self._on_scan_done)
+        thread.finished.connect(thread.deleteLater)
+        self._scan_thread = thread
+        thread.start()
+
+    def _on_scan_batch(self, batch: list) -> None:
+        if self.sender() is not self._scan_thread:
+            return   # queued from a scan that has since been cancelled
+        paths = [fp for fp, _ in batch]
+        self.track_model.append_tracks(paths, dict(batch))
+        self._unprobed.extend(fp for fp, cached in batch if cached is None)
+        self.library_files.extend(paths)
+        self.track_count_label.setText(f"{len(self.library_files)} tracks")
+
+    def _on_scan_done(self, total: int) -> None:
+        if self.sender() is not self._scan_thread:
+            return
+        self._scan_thread = None
+        if not total:
             self._status.showMessage("No audio files found in folder.")
             return
-
-        self.library_files = files
-        self._row_map = {}
-        self.track_table.setSortingEnabled(False)
-        try:
-            self.track_table.setRowCount(0)
-            self.track_table.setRowCount(len(files))
-            for i, fp in enumerate(files):
-                self._set_row(i, fp)
-                self._row_map[fp] = i
-                if is_cached(Path(fp)):
-                    cached = load_cached(Path(fp))
-                    if cached:
-                        self._update_row_from_results(fp, cached)
-        finally:
-            self.track_table.setSortingEnabled(True)
-        self.track_count_label.setText(f"{len(files)} tracks")
+        self.track_model.resort()   # batches were appended unsorted
         self.btn_analyze_all.setEnabled(True)
-        self._status.showMessage(f"Loaded {len(files)} tracks")
+        self._status.showMessage(f"Loaded {total} tracks")
+
+        # Second pass: header info for tracks that still need analysing
+        if self._unprobed:
+            thread = ProbeThread(self._unprobed, self)
+            thread.batch.connect(self._on_probe_batch)
+            thread.finished.connect(thread.deleteLater)
+            self._probe_thread = thread
+            self._unprobed = []
+            thread.start()
+
+    def _on_probe_batch(self, batch: list) -> None:
+        if self.sender() is not self._probe_thread:
+            return   # queued from a probe that has since been cancelled
+        self.track_model.set_audio_info_many(dict(batch))
+
+    def _cancel_scan(self) -> None:
+        """Stop a folder scan in progress; its queued results are ignored."""
+        if self._scan_thread is not None:
+            self._scan_thread.requestInterruption()
+            self._scan_thread = None
+        if self._probe_thread is not None:
+            self._probe_thread.requestInterruption()
+            self._probe_thread = None
+        self._unprobed = []
+
+    def closeEvent(self, event) -> None:
+        # Scan/probe/export threads are parented to the window: stop them
+        # (including scans already cancelled but still winding down) before
+        # it goes away. An export stops after the file it is copying.
+        threads = (self.findChildren(ScanThread) + self.findChildren(ProbeThread)
+                   + self.findChildren(ExportThread))
+        for thread in threads:
+            thread.requestInterruption()
+        for thread in threads:
+            thread.wait()
+        super().closeEvent(event)
 
     def _clear_library(self):
         """Reset the library to its initial empty state."""
@@ -1348,20 +1845,16 @@ class MainWindow(QMainWindow):
         self.audio_player.stop_loop()
         self.audio_player.stop()
 
-        # 2. Cancel running analysis threads
+        # 2. Cancel running analysis threads and any folder scan
+        self._cancel_scan()
         if self.batch_thread and self.batch_thread.isRunning():
             self.batch_thread.cancel()
-        if self.analysis_thread is not None:
-            try:
-                self.analysis_thread.finished.disconnect()
-                self.analysis_thread.error.disconnect()
-            except (TypeError, RuntimeError):
-                pass
+        self._analysis_pool.clear()
+        self._analysis_request += 1   # a running analysis finishes unseen
 
         # 3. Clear track table and data
-        self.track_table.setRowCount(0)
+        self.track_model.clear()
         self.library_files = []
-        self._row_map = {}
         self.current_track = None
 
         # 4. Reset detail panel
@@ -1398,6 +1891,7 @@ class MainWindow(QMainWindow):
         self.seek_slider.setValue(0)
         self.seek_slider.setEnabled(False)
         self.lbl_time.setText("0:00 / 0:00")
+        self._time_label_secs = None
         self.btn_analyze_all.setEnabled(False)
         self.btn_analyze_all.setText("Analyze All")
         self.batch_progress.setVisible(False)
@@ -1405,131 +1899,67 @@ class MainWindow(QMainWindow):
 
         self._status.showMessage("Library cleared")
 
-    def _set_row(self, row: int, file_path: str):
-        name = Path(file_path).stem
-        item = QTableWidgetItem(name)
-        item.setData(Qt.ItemDataRole.UserRole, file_path)
-        item.setToolTip(file_path)
-        self.track_table.setItem(row, 0, item)
-        self.track_table.setItem(row, 1, QTableWidgetItem("--"))
-        self.track_table.setItem(row, 2, QTableWidgetItem("--"))
-        self.track_table.setItem(row, 3, QTableWidgetItem("--"))   # Energy
-        self.track_table.setItem(row, 4, QTableWidgetItem(""))     # Genre (filled later)
-        self.track_table.setItem(row, 5, QTableWidgetItem("\u00b7"))  # · (pending ✓)
-
     # ------------------------------------------------------------------
     # Track selection & analysis
     # ------------------------------------------------------------------
 
     def _on_track_selected(self):
-        rows = self.track_table.selectedItems()
-        if not rows:
+        fp = self._selected_file_path(self.track_table)
+        if fp is None:
             return
         # Clear playlist selection so only one table has a selection
         self.playlist_table.blockSignals(True)
         self.playlist_table.clearSelection()
         self.playlist_table.blockSignals(False)
-        row = rows[0].row()
-        fp_item = self.track_table.item(row, 0)
-        if fp_item:
-            fp = fp_item.data(Qt.ItemDataRole.UserRole)
-            if fp:
-                self._start_analysis(fp)
+        self._start_analysis(fp)
 
     def _on_playlist_track_clicked(self, row: int, _col: int):
         """Load the clicked playlist track and clear library selection."""
-        self.track_table.blockSignals(True)
+        selection = self.track_table.selectionModel()
+        selection.blockSignals(True)
         self.track_table.clearSelection()
-        self.track_table.blockSignals(False)
+        selection.blockSignals(False)
+        self.track_table.viewport().update()
         fp_item = self.playlist_table.item(row, 0)
         if fp_item:
             fp = fp_item.data(Qt.ItemDataRole.UserRole)
             if fp:
                 self._start_analysis(fp)
 
+    def _ensure_analyzer(self):
+        """Import and build the shared AudioAnalyzer on first use (scipy is slow to import)."""
+        if self.analyzer is None:
+            from analyzer.audio_analyzer import AudioAnalyzer
+            self.analyzer = AudioAnalyzer()
+        return self.analyzer
+
     def _start_analysis(self, file_path: str):
         self._status.showMessage(f"Analyzing: {Path(file_path).name}\u2026")
-        row = self._row_map.get(file_path)
-        if row is not None:
-            self._highlight_row(row, ROW_ANALYZING)
-
-        # Disconnect previous thread to prevent stale results
-        if self.analysis_thread is not None:
-            try:
-                self.analysis_thread.finished.disconnect()
-                self.analysis_thread.error.disconnect()
-            except RuntimeError:
-                pass  # already disconnected
+        self.track_model.set_background(file_path, ROW_ANALYZING)
 
-        self.analysis_thread = AnalysisThread(file_path)
-        self.analysis_thread.finished.connect(self._on_analysis_done)
-        self.analysis_thread.error.connect(self._on_analysis_error)
-        self.analysis_thread.start()
+        # Drop requests still queued behind the running one; its result is ignored
+        self._analysis_pool.clear()
+        self._analysis_request += 1
+        self._analysis_pool.start(AnalysisTask(
+            self._analysis_request, file_path, self._ensure_analyzer(),
+            self._analysis_signals))
 
-    def _on_analysis_done(self, results: dict):
+    def _on_analysis_done(self, request_id: int, results: dict):
+        if request_id != self._analysis_request:
+            return
         self.current_track = results
         fp = results['file_path']
         self._update_row_from_results(fp, results)
         self._display_track(results)
         self._status.showMessage(f"Ready: {results['filename']}")
 
-    def _on_analysis_error(self, msg: str):
+    def _on_analysis_error(self, request_id: int, msg: str):
+        if request_id != self._analysis_request:
+            return
         self._status.showMessage(f"Error: {msg}")
 
     def _update_row_from_results(self, file_path: str, results: dict):
-        row = self._row_map.get(file_path)
-        if row is None:
-            return
-        bpm          = results.get('bpm')
-        key          = results.get('key', {})
-        energy       = results.get('energy', {})
-        camelot      = key.get('camelot', '--')
-        energy_level = energy.get('level')
-
-        # BPM — numeric sort
-        bpm_item = NumericTableWidgetItem(str(bpm) if bpm else "--")
-        bpm_item.setData(Qt.ItemDataRole.UserRole, float(bpm) if bpm else 999.0)
-        self.track_table.setItem(row, 1, bpm_item)
-
-        # Key — Camelot sort order
-        key_item = NumericTableWidgetItem(camelot)
-        key_item.setData(Qt.ItemDataRole.UserRole, _camelot_sort_key(camelot))
-        self.track_table.setItem(row, 2, key_item)
-
-        # Energy — numeric sort
-        nrg_item = NumericTableWidgetItem(str(energy_level) if energy_level else "--")
-        nrg_item.setData(Qt.ItemDataRole.UserRole, int(energy_level) if energy_level else 0)
-        self.track_table.setItem(row, 3, nrg_item)
-
-        # Status ✓ — now in col 5 (col 4 reserved for Genre)
-        self.track_table.setItem(row, 5, QTableWidgetItem("\u2713"))
-
-        # Low-bitrate flag: mark tracks below 320 kbps in orange
-        ai = results.get('audio_info', {})
-        br = ai.get('bitrate', 0)
-        name_item = self.track_table.item(row, 0)
-        if name_item and br and 0 < br < 320:
-            stem = Path(file_path).stem
-            name_item.setText(f"⚑ {stem}")
-            name_item.setForeground(QColor("#FF8C00"))
-            name_item.setToolTip(f"Low bitrate: {br} kbps (< 320 kbps)\n{file_path}")
-        self._highlight_row(row, ROW_DONE)
-
-    def _highlight_row(self, row: int, color: QColor):
-        for col in range(self.track_table.columnCount()):
-            item = self.track_table.item(row, col)
-            if item:
-                item.setBackground(color)
-
-    def _rebuild_row_map(self) -> None:
-        """Rebuild _row_map after table sort — keeps file_path→row_index accurate."""
-        self._row_map = {}
-        for row in range(self.track_table.rowCount()):
-            item = self.track_table.item(row, 0)
-            if item:
-                fp = item.data(Qt.ItemDataRole.UserRole)
-                if fp:
-                    self._row_map[fp] = row
+        self.track_model.apply_results(file_path, results)
 
     # ------------------------------------------------------------------
     # Downloads integration
@@ -1545,25 +1975,18 @@ class MainWindow(QMainWindow):
             self._status.showMessage(f"File not found: {fp.name}", 4000)
             return
 
-        if file_path in self._row_map:
+        if file_path in self.track_model:
             # Already in library — just (re-)analyse it
             self._main_tabs.setCurrentIndex(0)
             self._start_analysis(file_path)
             return
 
         # Add a new pending row (mirrors the single-file load pattern)
-        self.track_table.setSortingEnabled(False)
-        try:
-            row = self.track_table.rowCount()
-            self.track_table.insertRow(row)
-            self._set_row(row, file_path)
-            self._row_map[file_path] = row
-            self.library_files.append(file_path)
-            self.track_count_label.setText(f"{len(self.library_files)} tracks")
-            self._highlight_row(row, ROW_PENDING)
-        finally:
-            self.track_table.setSortingEnabled(True)
-            self._rebuild_row_map()
+        self.track_model.append_tracks([file_path])
+        self.track_model.resort()
+        self.library_files.append(file_path)
+        self.track_count_label.setText(f"{len(self.library_files)} tracks")
+        self.track_model.set_background(file_path, ROW_PENDING)
 
         # Switch to Library tab and begin analysis
         self._main_tabs.setCurrentIndex(0)
@@ -1593,6 +2016,7 @@ class MainWindow(QMainWindow):
             return
         if self.batch_thread and self.batch_thread.isRunning():
             self.batch_thread.cancel()
+            self._pending_progress = None   # buffered results still land; stale progress doesn't
             self.btn_analyze_all.setText("Analyze All")
             self.batch_progress.setVisible(False)
             return
@@ -1609,13 +2033,29 @@ class MainWindow(QMainWindow):
         self.batch_thread.start()
 
     def _on_batch_track_done(self, file_path: str, results: dict, current: int, total: int):
-        self._update_row_from_results(file_path, results)
+        self._pending_updates[file_path] = results
+        if not self._batch_flush_timer.isActive():
+            self._batch_flush_timer.start()
 
     def _on_batch_progress(self, current: int, total: int):
-        self.batch_progress.setValue(current)
-        self._status.showMessage(f"Analyzing {current}/{total}\u2026")
+        self._pending_progress = (current, total)
+        if not self._batch_flush_timer.isActive():
+            self._batch_flush_timer.start()
+
+    def _flush_batch_updates(self) -> None:
+        """Apply buffered batch results in one model update, then the latest progress."""
+        self._batch_flush_timer.stop()
+        pending, self._pending_updates = self._pending_updates, {}
+        if pending:
+            self.track_model.apply_results_many(pending)
+        if self._pending_progress is not None:
+            current, total = self._pending_progress
+            self._pending_progress = None
+            self.batch_progress.setValue(current)
+            self._status.showMessage(f"Analyzing {current}/{total}\u2026")
 
     def _on_batch_all_done(self, analyzed: int, cached: int):
+        self._flush_batch_updates()
         self.btn_analyze_all.setText("Analyze All")
         self.batch_progress.setVisible(False)
         self._status.showMessage(
@@ -1643,12 +2083,7 @@ class MainWindow(QMainWindow):
 
     def _on_genre_done(self, file_path: str, genres_str: str) -> None:
         """Update the Genre column (col 4) when GenreWorker emits a result."""
-        row = self._row_map.get(file_path)
-        if row is None:
-            return
-        item = QTableWidgetItem(genres_str)
-        item.setToolTip(genres_str)
-        self.track_table.setItem(row, 4, item)
+        self.track_model.set_genre(file_path, genres_str)
 
     # ------------------------------------------------------------------
     # Detail panel display
@@ -1693,6 +2128,7 @@ class MainWindow(QMainWindow):
         # Seek slider
         self.seek_slider.setMaximum(max(1, dur_sec * 10))
         self.lbl_time.setText(f"0:00 / {mm}:{ss:02d}")
+        self._time_label_secs = None
 
         # Reset cues for the new track
         self._load_hot_cues(results['file_path'])
@@ -1775,16 +2211,35 @@ class MainWindow(QMainWindow):
         self.audio_player.seek(new_pos / self.audio_player.duration)
 
     def _on_position_changed(self, pos: float):
+        # The player only signals on transitions; drive the playhead ourselves while it runs
+        if self.audio_player.is_playing:
+            if not self._playhead_timer.isActive():
+                self._playhead_timer.start()
+        else:
+            self._playhead_timer.stop()
         self.waveform.set_playback_position(pos)
         if not self._seek_dragging:
             self.seek_slider.setValue(int(pos * self.seek_slider.maximum()))
         if self.current_track:
             total_sec = int(self.current_track.get('duration', 0))
             cur_sec   = int(pos * total_sec)
-            self.lbl_time.setText(
-                f"{cur_sec // 60}:{cur_sec % 60:02d} / "
-                f"{total_sec // 60}:{total_sec % 60:02d}"
-            )
+            # Playhead ticks arrive several times a second; the label only
+            # changes when the second rolls over
+            if (cur_sec, total_sec) != self._time_label_secs:
+                self._time_label_secs = (cur_sec, total_sec)
+                self.lbl_time.setText(
+                    f"{cur_sec // 60}:{cur_sec % 60:02d} / "
+                    f"{total_sec // 60}:{total_sec % 60:02d}"
+                )
+
+    def _refresh_playhead(self):
+        """Playhead timer tick: redraw only if the position moved by at least 1 ms."""
+        pos = self.audio_player.get_position()
+        ms = int(pos * self.audio_player.duration * 1000)
+        if ms == self._playhead_ms:
+            return
+        self._playhead_ms = ms
+        self._on_position_changed(pos)
 
     def _on_playback_finished(self):
         self.btn_play.setText("\u25b6  Play")
@@ -1864,15 +2319,18 @@ class MainWindow(QMainWindow):
         self._save_playlists()
         self._refresh_playlist_table()
 
-    def _play_selected_track(self, table: QTableWidget) -> None:
-        rows = table.selectedItems()
+    def _play_selected_track(self, table: QTableView) -> None:
+        fp = self._selected_file_path(table)
+        if fp:
+            self._start_analysis(fp)
+
+    @staticmethod
+    def _selected_file_path(table: QTableView) -> str | None:
+        """File path (column 0 UserRole) of the first selected row, if any."""
+        rows = table.selectionModel().selectedRows()
         if not rows:
-            return
-        fp_item = table.item(rows[0].row(), 0)
-        if fp_item:
-            fp = fp_item.data(Qt.ItemDataRole.UserRole)
-            if fp:
-                self._start_analysis(fp)
+            return None
+        return rows[0].data(Qt.ItemDataRole.UserRole) or None
 
 
     # ------------------------------------------------------------------
@@ -1982,9 +2440,14 @@ class MainWindow(QMainWindow):
         self.lbl_similar_status.setText("Searching…")
         QApplication.processEvents()
 
-        results = find_similar(query_fp, candidates,
-                               cache_dir=get_cache_dir(), top_n=25)
+        compatible_only = self.chk_similar_compatible.isChecked()
+        results = find_similar(query_fp, candidates, cache_dir=get_cache_dir(),
+                               top_n=25, compatible_only=compatible_only)
         self._populate_similar_table(results)
+        if not results and compatible_only:
+            self.lbl_similar_status.setText(
+                "No BPM/key-compatible matches — untick 'Compatible only' to search everything"
+            )
         self.bottom_tabs.setCurrentWidget(self.similar_widget)
 
     def _populate_similar_table(self, results: list) -> None:
@@ -2049,6 +2512,9 @@ class MainWindow(QMainWindow):
             self._remove_from_playlist(fp)
 
     def _export_playlist(self) -> None:
+        if self._export_thread is not None:
+            self._status.showMessage("An export is already running.")
+            return
         idx = self.playlist_selector.currentIndex()
         if idx < 0:
             return
@@ -2065,17 +2531,17 @@ class MainWindow(QMainWindow):
         except OSError as e:
             self._status.showMessage(f"Export failed: could not create folder — {e}")
             return
-        copied = skipped = errors = 0
-        for track_path in pl['tracks']:
-            src = Path(track_path)
-            if src.exists():
-                try:
-                    shutil.copy2(src, out_dir / src.name)
-                    copied += 1
-                except OSError:
-                    errors += 1
-            else:
-                skipped += 1
+        thread = ExportThread(list(pl['tracks']), out_dir, self)
+        thread.progress.connect(
+            lambda i, n: self._status.showMessage(f"Exporting {i}/{n} to {out_dir}…"))
+        thread.done.connect(
+            lambda c, s, e: self._on_export_done(out_dir, c, s, e))
+        thread.finished.connect(thread.deleteLater)
+        self._export_thread = thread
+        thread.start()
+
+    def _on_export_done(self, out_dir: Path, copied: int, skipped: int, errors: int) -> None:
+        self._export_thread = None
         msg = f"Exported {copied} tracks to {out_dir}"
         if skipped:
             msg += f" ({skipped} not found)"
@@ -2087,25 +2553,18 @@ class MainWindow(QMainWindow):
     # Search / filter
     # ------------------------------------------------------------------
 
-    def _filter_tracks(self, text: str):
-        for row in range(self.track_table.rowCount()):
-            item = self.track_table.item(row, 0)
-            match = (text.lower() in item.text().lower()) if item else True
-            self.track_table.setRowHidden(row, not match)
+    def _filter_tracks(self):
+        self.track_proxy.set_needle(self.search_box.text())
 
     # ------------------------------------------------------------------
     # Context menu
     # ------------------------------------------------------------------
 
     def _library_context_menu(self, pos: QPoint):
-        item = self.track_table.itemAt(pos)
-        if not item:
-            return
-        row = item.row()
-        fp_item = self.track_table.item(row, 0)
-        if not fp_item:
+        index = self.track_table.indexAt(pos)
+        if not index.isValid():
             return
-        fp = fp_item.data(Qt.ItemDataRole.UserRole)
+        fp = index.siblingAtColumn(0).data(Qt.ItemDataRole.UserRole)
 
         menu = QMenu(self)
         action_analyze = menu.addAction("Re-analyze")
@@ -2131,12 +2590,8 @@ class MainWindow(QMainWindow):
             self._start_analysis(fp)
         elif action == action_reveal and fp:
             os.startfile(str(Path(fp).parent))
-        elif action == sim_action:
-            fp_item = self.track_table.item(row, 0)
-            if fp_item:
-                fp = fp_item.data(Qt.ItemDataRole.UserRole)
-                if fp:
-                    self._find_similar_after_load = True
-                    self._start_analysis(fp)
+        elif action == sim_action and fp:
+            self._find_similar_after_load = True
+            self._start_analysis(fp)
         elif action in playlist_actions and fp:
             self._add_to_playlist(fp, playlist_actions[action])
@@ -79,7 +79,7 @@ QPushButton#btn_play:hover {
 }
 
 /* ─── Track Table ───────────────────────────────────────── */
-QTableWidget {
+QTableView {
     background-color: #0a0a0f;
     alternate-background-color: #0d0d18;
     border: 1px solid #1a2233;
@@ -88,11 +88,11 @@ QTableWidget {
     selection-background-color: #0d2244;
     selection-color: #ffffff;
 }
-QTableWidget::item {
+QTableView::item {
     padding: 4px 6px;
     border: none;
 }
-QTableWidget::item:selected {
+QTableView::item:selected {
     background-color: #0d2244;
     color: #00ccff;
 }
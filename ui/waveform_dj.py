@@ -21,9 +21,13 @@ Color mapping:
 Played portion: bars left of playhead rendered at 35% brightness.
 
 Rendering: paintEvent reads pre-computed numpy data (no FFT in paint loop).
-Data generation runs in WaveformDataThread (background QThread).
+Data generation runs in WaveformDataThread (background QThread); the bars
+are cached on disk as int16 so replaying a track skips the decode.
 """
 
+import hashlib
+from pathlib import Path
+
 import numpy as np
 from PyQt6.QtWidgets import QWidget, QVBoxLayout
 from PyQt6.QtCore import Qt, QThread, pyqtSignal
@@ -55,6 +59,43 @@ def _mix_color(amp: float, bass: float, mid: float, high: float) -> QColor:
     return QColor(int(r), int(g), int(b))
 
 
+# ── On-disk bar cache ─────────────────────────────────────────────────────────
+# All four columns are in 0–1, so int16 keeps ~5 significant digits at half
+# the size of float32.
+
+_PEAKS_SCALE = 32767.0
+
+
+def _peaks_cache_file(file_path: str) -> Path:
+    """Cache file for a track's bars: md5 of path + mtime + size, like batch_analyzer."""
+    from paths import get_cache_dir
+    path = Path(file_path)
+    stat = path.stat()
+    key_str = f"{path.absolute()}|{stat.st_mtime}|{stat.st_size}"
+    key = hashlib.md5(key_str.encode(), usedforsecurity=False).hexdigest()
+    return get_cache_dir() / f"{key}.peaks"
+
+
+def load_cached_bars(file_path: str, n_bars: int) -> np.ndarray | None:
+    """Return cached (n_bars, 4) float32 bars, or None if absent / stale."""
+    try:
+        raw = np.fromfile(_peaks_cache_file(file_path), dtype=np.int16)
+    except (OSError, ValueError):
+        return None
+    if raw.size != n_bars * 4:
+        return None
+    return raw.reshape(n_bars, 4).astype(np.float32) / _PEAKS_SCALE
+
+
+def save_cached_bars(file_path: str, bars: np.ndarray) -> None:
+    """Quantize bars to int16 and write them to the peaks cache."""
+    try:
+        q = np.rint(np.clip(bars, 0.0, 1.0) * _PEAKS_SCALE).astype(np.int16)
+        q.tofile(_peaks_cache_file(file_path))
+    except OSError as exc:
+        print(f"[waveform] Could not cache waveform: {exc}")
+
+
 # ── Background data computation thread ───────────────────────────────────────
 
 class WaveformDataThread(QThread):
@@ -81,6 +122,11 @@ class WaveformDataThread(QThread):
         self.wait(1000)
 
     def run(self):
+        cached = load_cached_bars(self.file_path, self.N_BARS)
+        if cached is not None:
+            if not self._stop:
+                self.data_ready.emit(cached)
+            return
         try:
             import soundfile as sf
             import soxr
@@ -108,6 +154,7 @@ class WaveformDataThread(QThread):
 
             bars = self._compute_bars(data, self.SR)
             if not self._stop:
+                save_cached_bars(self.file_path, bars)
                 self.data_ready.emit(bars)
 
         except Exception as e:
@@ -179,7 +226,10 @@ class _BaseWaveform(QWidget):
         self.update()
 
     def set_position(self, pos: float) -> None:
-        self._position = max(0.0, min(1.0, pos))
+        pos = max(0.0, min(1.0, pos))
+        if pos == self._position:
+            return
+        self._position = pos
         self.update()
 
     def clear(self) -> None: